@@ -11,25 +11,25 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from main import AnalizadorRobot
 
+# Datos de prueba; se construyen una sola vez al importar el módulo
+_TEST_DATA = (
+    ("Team", "Match", "Coral L1 (Auto)", "Coral L2 (Auto)", "Coral L3 (Auto)", "Coral L4 (Auto)",
+     "Coral L1 (Teleop)", "Coral L2 (Teleop)", "Coral L3 (Teleop)", "Coral L4 (Teleop)",
+     "Barge Algae (Auto)", "Barge Algae (Teleop)", "Processor Algae (Auto)", "Processor Algae (Teleop)",
+     "Moved (Auto)", "End Position"),
+    ("1000", "Q1", "2", "1", "1", "0", "3", "2", "1", "1", "1", "2", "1", "2", "True", "deep"),
+    ("1000", "Q2", "3", "2", "0", "1", "4", "3", "2", "0", "0", "3", "2", "1", "True", "shallow"),
+    ("2000", "Q1", "1", "0", "0", "0", "2", "1", "0", "0", "0", "1", "0", "1", "False", "park"),
+    ("2000", "Q2", "2", "1", "1", "0", "3", "2", "1", "0", "1", "2", "1", "2", "True", "none")
+)
+
 def inspect_team_stats():
     """Inspecciona las claves de estadísticas disponibles"""
     print("Inspeccionando claves de estadísticas del analizador...")
     
-    # Crear datos de prueba
-    test_data = [
-        ["Team", "Match", "Coral L1 (Auto)", "Coral L2 (Auto)", "Coral L3 (Auto)", "Coral L4 (Auto)",
-         "Coral L1 (Teleop)", "Coral L2 (Teleop)", "Coral L3 (Teleop)", "Coral L4 (Teleop)",
-         "Barge Algae (Auto)", "Barge Algae (Teleop)", "Processor Algae (Auto)", "Processor Algae (Teleop)",
-         "Moved (Auto)", "End Position"],
-        ["1000", "Q1", "2", "1", "1", "0", "3", "2", "1", "1", "1", "2", "1", "2", "True", "deep"],
-        ["1000", "Q2", "3", "2", "0", "1", "4", "3", "2", "0", "0", "3", "2", "1", "True", "shallow"],
-        ["2000", "Q1", "1", "0", "0", "0", "2", "1", "0", "0", "0", "1", "0", "1", "False", "park"],
-        ["2000", "Q2", "2", "1", "1", "0", "3", "2", "1", "0", "1", "2", "1", "2", "True", "none"]
-    ]
-    
     # Inicializar analizador
     analizador = AnalizadorRobot()
-    analizador.sheet_data = test_data
+    analizador.sheet_data = [list(row) for row in _TEST_DATA]
     analizador._update_column_indices()
     
     # Obtener estadísticas
@@ -2158,7 +2158,7 @@ class AnalizadorGUI:
             if combo_index < len(self._alliance_selector_combos):
                 pick1_combo = self._alliance_selector_combos[combo_index]
                 available_pick1 = selector.get_available_teams(alliance.captainRank, 'pick1')
-                pick1_options = [("", "No selection")] + [(str(t.team), f"{t.team} (Score: {t.score:.1f})") for t in available_pick1]
+                pick1_options = [("", "No selection")] + [(str(t.team), f"{t.team} (Score: {selector.get_team_score(t.team):.1f})") for t in available_pick1]
                 pick1_combo['values'] = [label for _, label in pick1_options]
                 
                 # Preserve current selection if it's still valid
@@ -2177,7 +2177,7 @@ class AnalizadorGUI:
             if combo_index < len(self._alliance_selector_combos):
                 pick2_combo = self._alliance_selector_combos[combo_index]
                 available_pick2 = selector.get_available_teams(alliance.captainRank, 'pick2')
-                pick2_options = [("", "No selection")] + [(str(t.team), f"{t.team} (Score: {t.score:.1f})") for t in available_pick2]
+                pick2_options = [("", "No selection")] + [(str(t.team), f"{t.team} (Score: {selector.get_team_score(t.team):.1f})") for t in available_pick2]
                 pick2_combo['values'] = [label for _, label in pick2_options]
                 
                 # Preserve current selection if it's still valid
@@ -2228,7 +2228,7 @@ class AnalizadorGUI:
             # Pick 1 Combobox
             pick1_var = tk.StringVar(value=str(a.pick1) if a.pick1 else "")
             available_pick1 = selector.get_available_teams(a.captainRank, 'pick1')
-            pick1_options = [("", "No selection")] + [(str(t.team), f"{t.team} (Score: {t.score:.1f})") for t in available_pick1]
+            pick1_options = [("", "No selection")] + [(str(t.team), f"{t.team} (Score: {selector.get_team_score(t.team):.1f})") for t in available_pick1]
             pick1_combo = ttk.Combobox(self.alliance_selector_controls, textvariable=pick1_var,
                                        values=[label for _, label in pick1_options], state="readonly", width=18)
             # Set current value
@@ -2245,7 +2245,7 @@ class AnalizadorGUI:
                 
                 # Get current available teams dynamically
                 current_available = selector.get_available_teams(selector.alliances[idx].captainRank, 'pick1')
-                current_options = [("", "No selection")] + [(str(t.team), f"{t.team} (Score: {t.score:.1f})") for t in current_available]
+                current_options = [("", "No selection")] + [(str(t.team), f"{t.team} (Score: {selector.get_team_score(t.team):.1f})") for t in current_available]
                 
                 for val, label in current_options:
                     if label == selected_label:
@@ -2271,7 +2271,7 @@ class AnalizadorGUI:
             # Pick 2 Combobox
             pick2_var = tk.StringVar(value=str(a.pick2) if a.pick2 else "")
             available_pick2 = selector.get_available_teams(a.captainRank, 'pick2')
-            pick2_options = [("", "No selection")] + [(str(t.team), f"{t.team} (Score: {t.score:.1f})") for t in available_pick2]
+            pick2_options = [("", "No selection")] + [(str(t.team), f"{t.team} (Score: {selector.get_team_score(t.team):.1f})") for t in available_pick2]
             pick2_combo = ttk.Combobox(self.alliance_selector_controls, textvariable=pick2_var,
                                        values=[label for _, label in pick2_options], state="readonly", width=18)
             if a.pick2:
@@ -2287,7 +2287,7 @@ class AnalizadorGUI:
                 
                 # Get current available teams dynamically
                 current_available = selector.get_available_teams(selector.alliances[idx].captainRank, 'pick2')
-                current_options = [("", "No selection")] + [(str(t.team), f"{t.team} (Score: {t.score:.1f})") for t in current_available]
+                current_options = [("", "No selection")] + [(str(t.team), f"{t.team} (Score: {selector.get_team_score(t.team):.1f})") for t in current_available]
                 
                 for val, label in current_options:
                     if label == selected_label:
@@ -1,12 +1,40 @@
-# Enhanced scoring weights based on comprehensive analysis
-W_AUTO = 1.5      # Increased weight for autonomous performance 
-W_TELEOP = 1.0    # Base teleop weight
-W_ENDGAME = 1.2   # Increased weight for endgame (critical for close matches)
-W_DEFENSE = 12    # Slightly reduced but still significant for defensive teams
-W_CONSISTENCY = 5 # New weight for consistency bonus
-W_CLUTCH = 8      # New weight for high-pressure performance
+import sys
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+from config_manager import get_global_config
+
+# dataclass(slots=True) needs Python 3.10; older interpreters get regular instance dicts
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class ScoringWeights:
+    """Enhanced scoring weights based on comprehensive analysis"""
+    auto: float = 1.5        # Increased weight for autonomous performance
+    teleop: float = 1.0      # Base teleop weight
+    endgame: float = 1.2     # Increased weight for endgame (critical for close matches)
+    defense: float = 12      # Slightly reduced but still significant for defensive teams
+    consistency: float = 5   # New weight for consistency bonus
+    clutch: float = 8        # New weight for high-pressure performance
+
+    @classmethod
+    def from_config(cls, weights):
+        """Build weights from an alliance.json scoring_weights mapping, keeping defaults for missing keys"""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: float(value) for key, value in (weights or {}).items() if key in names})
+
+    def as_vector(self):
+        return np.array([self.auto, self.teleop, self.endgame,
+                         self.defense, self.consistency, self.clutch], dtype=float)
+
+DEFAULT_WEIGHTS = ScoringWeights()
 
 class Team:
+    __slots__ = ("team", "rank", "total_epa", "auto_epa", "teleop_epa", "endgame_epa", "defense", "name",
+                 "robot_valuation", "consistency_score", "clutch_factor", "death_rate", "defended_rate",
+                 "defense_rate", "algae_score", "score")
+
     def __init__(self, num, rank, total_epa, auto_epa, teleop_epa, endgame_epa, defense=False, name=None,
                  robot_valuation=0, consistency_score=0, clutch_factor=0, death_rate=0.0, defended_rate=0.0,
                  defense_rate=0.0, algae_score=0.0):
@@ -20,32 +48,32 @@ class Team:
         self.name = name if name else str(num)
         
         # Enhanced attributes for better team evaluation
-        self.robot_valuation = float(robot_valuation) if robot_valuation else 0
-        self.consistency_score = float(consistency_score) if consistency_score else 0
-        self.clutch_factor = float(clutch_factor) if clutch_factor else 0
-        self.death_rate = float(death_rate) if death_rate else 0.0
-        self.defended_rate = float(defended_rate) if defended_rate else 0.0
-        self.defense_rate = float(defense_rate) if defense_rate else 0.0
-        self.algae_score = float(algae_score) if algae_score else 0.0
+        self.robot_valuation = float(robot_valuation or 0.0)
+        self.consistency_score = float(consistency_score or 0.0)
+        self.clutch_factor = float(clutch_factor or 0.0)
+        self.death_rate = float(death_rate or 0.0)
+        self.defended_rate = float(defended_rate or 0.0)
+        self.defense_rate = float(defense_rate or 0.0)
+        self.algae_score = float(algae_score or 0.0)
         
         self.score = self.compute_score()
 
-    def compute_score(self):
+    def compute_score(self, weights=DEFAULT_WEIGHTS):
         """Enhanced scoring algorithm that considers multiple factors"""
         base_score = (
-            W_AUTO * self.auto_epa +
-            W_TELEOP * self.teleop_epa +
-            W_ENDGAME * self.endgame_epa
+            weights.auto * self.auto_epa +
+            weights.teleop * self.teleop_epa +
+            weights.endgame * self.endgame_epa
         )
         
         # Defense bonus
-        defense_bonus = W_DEFENSE if self.defense else 0
+        defense_bonus = weights.defense if self.defense else 0
         
         # Consistency bonus (higher is better, penalize inconsistent teams)
-        consistency_bonus = (self.consistency_score / 100) * W_CONSISTENCY
+        consistency_bonus = (self.consistency_score / 100) * weights.consistency
         
         # Clutch factor bonus (ability to perform under pressure)
-        clutch_bonus = (self.clutch_factor / 100) * W_CLUTCH
+        clutch_bonus = (self.clutch_factor / 100) * weights.clutch
         
         # Robot valuation factor (scales with overall robot quality)
         valuation_multiplier = 1.0 + (self.robot_valuation / 1000)  # Small but meaningful boost
@@ -74,7 +102,34 @@ class Team:
             "algae_score": self.algae_score
         }
 
+def _score_components(auto, teleop, endgame, defense, consistency, clutch, valuation):
+    """Weight-independent parts of Team.compute_score: a (teams x 6) feature matrix and the valuation multiplier"""
+    features = np.column_stack((auto, teleop, endgame, defense, consistency / 100, clutch / 100))
+    valuation_multiplier = 1.0 + (valuation / 1000)
+    return features, valuation_multiplier
+
+def _team_components(teams):
+    """_score_components for already-built teams"""
+    return _score_components(
+        np.array([t.auto_epa for t in teams], dtype=float),
+        np.array([t.teleop_epa for t in teams], dtype=float),
+        np.array([t.endgame_epa for t in teams], dtype=float),
+        np.array([t.defense for t in teams], dtype=bool),
+        np.array([t.consistency_score for t in teams], dtype=float),
+        np.array([t.clutch_factor for t in teams], dtype=float),
+        np.array([t.robot_valuation for t in teams], dtype=float),
+    )
+
+def _weighted_scores(components, weights):
+    """Vectorized Team.compute_score from _score_components output"""
+    features, valuation_multiplier = components
+    # One (teams x 6) feature matrix against the weight vector instead of six scaled adds
+    return (features @ weights.as_vector()) * valuation_multiplier
+
 class Alliance:
+    __slots__ = ("allianceNumber", "captain", "captainRank", "pick1", "pick2", "pick1Rec", "pick2Rec",
+                 "manual_captain")
+
     def __init__(self, number):
         self.allianceNumber = number
         self.captain = None
@@ -96,15 +151,59 @@ class Alliance:
             "pick2Rec": self.pick2Rec
         }
 
+def _pick2_key(team, score):
+    # Prioritize defensive specialists and algae scorers with reliable performance
+    return (
+        -team.defense_rate,
+        -team.algae_score,
+        team.death_rate,
+        -score,
+        team.rank
+    )
+
 class AllianceSelector:
-    def __init__(self, teams):
-        self.teams = sorted(teams, key=lambda t: t.rank)
+    def __init__(self, teams, weights=None):
+        # Weights are read once per selector; its scores live in _score_by_number, not on the teams
+        if weights is None:
+            weights = ScoringWeights.from_config(get_global_config().get_alliance_config().scoring_weights)
+        self.weights = weights
+        self._set_teams(teams)
         # For testing purposes, create reasonable number of alliances
         # In real FRC: 8 alliances for events with 24+ teams, fewer for smaller events
         max_alliances = min(8, max(1, len(teams) // 3))  # At least 3 teams per alliance
         self.alliances = [Alliance(i+1) for i in range(max_alliances)]
-        self.update_alliance_captains()
-        self.update_recommendations()
+        self._refresh()
+
+    def _set_teams(self, teams):
+        """Store the roster sorted by rank and index it by team number"""
+        teams = list(teams)
+        # Rosters from the analyzer usually arrive ranked already; only sort when they don't
+        if all(prev.rank <= team.rank for prev, team in zip(teams, teams[1:])):
+            self.teams = teams
+        else:
+            self.teams = sorted(teams, key=lambda t: t.rank)
+        # Score components are kept so set_weights can rescore with a single product
+        self._components = _team_components(self.teams)
+        self._by_number = {t.team: t for t in self.teams}
+        self._index_scores()
+
+    def _index_scores(self):
+        """Rebuild everything derived from team scores"""
+        # Scored with the selector's weights; the Team objects are shared with the caller and left untouched
+        scores = self._score_by_number = dict(zip(
+            (t.team for t in self.teams), _weighted_scores(self._components, self.weights).tolist()))
+        self._teams_by_score = sorted(self.teams, key=lambda t: (-scores[t.team], t.rank))
+        self._teams_by_pick2 = sorted(self.teams, key=lambda t: _pick2_key(t, scores[t.team]))
+        # Captains and recommendations derived from the old scores are stale
+        self._last_state = None
+
+    def set_weights(self, weights):
+        """Rescore the roster with new weights and refresh the recommendations"""
+        if weights == self.weights:
+            return
+        self.weights = weights
+        self._index_scores()
+        self._refresh()
 
     def get_selected_picks(self):
         selected = []
@@ -139,17 +238,26 @@ class AllianceSelector:
                 alliance.manual_captain = False
             elif alliance.captain is not None:
                 # Ensure captain rank stays in sync
-                for team in self.teams:
-                    if team.team == alliance.captain:
-                        alliance.captainRank = team.rank
-                        break
+                team = self._by_number.get(alliance.captain)
+                if team is not None:
+                    alliance.captainRank = team.rank
             else:
                 alliance.captain = None
                 alliance.captainRank = None
 
+    def _draft_sets(self):
+        """Picked team numbers and the alliance each captain leads, for one draft state"""
+        selected_picks = set(self.get_selected_picks())
+        captain_alliances = {}
+        for a in self.alliances:
+            if a.captain:
+                captain_alliances.setdefault(a.captain, a)
+        return selected_picks, captain_alliances
+
     def get_available_teams(self, drafting_captain_rank, pick_type):
-        selected_picks = self.get_selected_picks()
-        
+        return self._available_teams(drafting_captain_rank, pick_type, *self._draft_sets())
+
+    def _available_teams(self, drafting_captain_rank, pick_type, selected_picks, captain_alliances):
         # Find which alliance is making this pick
         drafting_alliance = None
         for a in self.alliances:
@@ -157,59 +265,33 @@ class AllianceSelector:
                 drafting_alliance = a
                 break
         
+        # Both orderings are precomputed per roster, so filtering keeps them sorted
+        ordered = self._teams_by_pick2 if pick_type == 'pick2' else self._teams_by_score
         available = []
-        for team in self.teams:
+        for team in ordered:
             # Exclude already selected picks
             if team.team in selected_picks:
                 continue
             
             # Check if this team is a captain
-            is_captain = False
-            captain_alliance = None
-            for a in self.alliances:
-                if a.captain == team.team:
-                    is_captain = True
-                    captain_alliance = a
-                    break
-            
-            if is_captain:
-                if drafting_alliance and captain_alliance:
+            captain_alliance = captain_alliances.get(team.team)
+            if captain_alliance:
+                if drafting_alliance:
                     # Captains can be drafted only by higher-ranked alliances (lower alliance number)
                     if drafting_alliance.allianceNumber == captain_alliance.allianceNumber:
                         continue
                     if drafting_alliance.allianceNumber > captain_alliance.allianceNumber:
                         continue
-                elif captain_alliance:
+                else:
                     # If no drafting alliance identified (failsafe), disallow picking own captain
                     continue
             
             # Team is available
             available.append(team)
-        
-        if pick_type == 'pick2':
-            def pick2_key(team):
-                # Prioritize defensive specialists and algae scorers with reliable performance
-                defense_priority = team.defense_rate if hasattr(team, 'defense_rate') else 0.0
-                algae_priority = team.algae_score if hasattr(team, 'algae_score') else 0.0
-                reliability_penalty = team.death_rate if hasattr(team, 'death_rate') else 0.0
-                return (
-                    -defense_priority,
-                    -algae_priority,
-                    reliability_penalty,
-                    -team.score,
-                    team.rank
-                )
-
-            available.sort(key=pick2_key)
-        else:
-            available.sort(key=lambda t: (-t.score, t.rank))
         return available
 
     def get_team_score(self, team_number):
-        for t in self.teams:
-            if t.team == team_number:
-                return t.score
-        return 0
+        return self._score_by_number.get(team_number, 0)
 
     def update_recommendations(self):
         # For each alliance, recommend the best available pick for pick1 and pick2
@@ -218,9 +300,13 @@ class AllianceSelector:
         recommended_pick1 = set()
         recommended_pick2 = set()
 
+        # Picks and captains don't change while recommending, so gather them once
+        selected_picks, captain_alliances = self._draft_sets()
+
         # Pick 1 (1-8)
         # New logic: Recommend the captain of the next alliance if available.
         all_captains = [a.captain for a in self.alliances if a.captain]
+        taken_teams = selected_picks.union(all_captains)
         
         for idx, a in enumerate(self.alliances):
             if not a.pick1:
@@ -231,13 +317,10 @@ class AllianceSelector:
                     target_captain_team = all_captains[idx + 1]
                 else:
                     # For the last alliance, find the next best team by rank not already a captain or picked
-                    selected_teams = set(self.get_selected_picks()) | set(all_captains)
-                    next_best_options = [t for t in self.teams if t.team not in selected_teams]
-                    next_best_options.sort(key=lambda t: t.rank)
-                    if next_best_options:
-                        target_captain_team = next_best_options[0].team
+                    # (self.teams is kept sorted by rank)
+                    target_captain_team = next((t.team for t in self.teams if t.team not in taken_teams), None)
 
-                available = self.get_available_teams(a.captainRank, 'pick1')
+                available = self._available_teams(a.captainRank, 'pick1', selected_picks, captain_alliances)
                 available_teams_set = {t.team for t in available}
                 
                 # Check if the desired target is available
@@ -259,7 +342,7 @@ class AllianceSelector:
         for idx in reversed(range(len(self.alliances))):
             a = self.alliances[idx]
             if not a.pick2:
-                available = self.get_available_teams(a.captainRank, 'pick2')
+                available = self._available_teams(a.captainRank, 'pick2', selected_picks, captain_alliances)
                 # Filter out already recommended teams for both pick types
                 available = [t for t in available if t.team not in recommended_pick2 and t.team not in recommended_pick1]
                 if available:
@@ -270,6 +353,18 @@ class AllianceSelector:
             else:
                 a.pick2Rec = None
 
+        self._last_state = self._state()
+
+    def _state(self):
+        return tuple((a.captain, a.manual_captain, a.pick1, a.pick2) for a in self.alliances)
+
+    def _refresh(self):
+        """Recompute captains and recommendations unless nothing changed since the last time"""
+        if self._last_state is not None and self._state() == self._last_state:
+            return
+        self.update_alliance_captains()
+        self.update_recommendations()
+
     def set_pick(self, alliance_index, pick_type, team_number):
         # Get the alliance that is making this pick
         picking_alliance = self.alliances[alliance_index]
@@ -277,8 +372,7 @@ class AllianceSelector:
         # Allow clearing a pick by passing None or 0
         if team_number in (None, 0):
             setattr(picking_alliance, pick_type, None)
-            self.update_alliance_captains()
-            self.update_recommendations()
+            self._refresh()
             return
 
         team_number = int(team_number)
@@ -293,20 +387,17 @@ class AllianceSelector:
             raise ValueError(f"Team {team_number} is already selected as a pick.")
         
         # Verify the team exists in our team list
-        team_exists = any(t.team == team_number for t in self.teams)
-        if not team_exists:
+        if team_number not in self._by_number:
             raise ValueError(f"Team {team_number} does not exist in the team list.")
         
         setattr(self.alliances[alliance_index], pick_type, team_number)
-        self.update_alliance_captains()
-        self.update_recommendations()
+        self._refresh()
 
     def reset_picks(self):
         for a in self.alliances:
             a.pick1 = None
             a.pick2 = None
-        self.update_alliance_captains()
-        self.update_recommendations()
+        self._refresh()
 
     def set_captain(self, alliance_index, team_number):
         alliance = self.alliances[alliance_index]
@@ -315,14 +406,13 @@ class AllianceSelector:
             alliance.captain = None
             alliance.captainRank = None
             alliance.manual_captain = False
-            self.update_alliance_captains()
-            self.update_recommendations()
+            self._refresh()
             return
 
         if team_number in self.get_selected_picks():
             raise ValueError(f"Team {team_number} is already selected as a pick and cannot be captain.")
 
-        team = next((t for t in self.teams if t.team == team_number), None)
+        team = self._by_number.get(team_number)
         if not team:
             raise ValueError(f"Team {team_number} does not exist in the team list.")
 
@@ -338,8 +428,7 @@ class AllianceSelector:
         alliance.captain = team.team
         alliance.captainRank = team.rank
         alliance.manual_captain = True
-        self.update_alliance_captains()
-        self.update_recommendations()
+        self._refresh()
 
     def get_available_captains(self, alliance_index):
         picks = set(self.get_selected_picks())
@@ -354,11 +443,9 @@ class AllianceSelector:
 
     def get_alliance_table(self):
         table = []
+        scores = self._score_by_number
         for a in self.alliances:
-            alliance_score = 0
-            if a.captain: alliance_score += self.get_team_score(a.captain)
-            if a.pick1: alliance_score += self.get_team_score(a.pick1)
-            if a.pick2: alliance_score += self.get_team_score(a.pick2)
+            alliance_score = scores.get(a.captain, 0) + scores.get(a.pick1, 0) + scores.get(a.pick2, 0)
             table.append({
                 "Alliance #": a.allianceNumber,
                 "Captain": a.captain,
@@ -392,7 +479,7 @@ class AllianceSelector:
         }
 
     def update_teams(self, teams):
-        self.teams = sorted(teams, key=lambda t: t.rank)
+        self._set_teams(teams)
         # Recalculate number of alliances based on new team count
         max_alliances = min(8, max(1, len(teams) // 2))
         
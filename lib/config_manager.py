@@ -8,15 +8,60 @@ It loads and provides access to all JSON configuration files:
 - game.json: Game point values for match simulation
 """
 
+import copy
 import json
-from dataclasses import dataclass, field
+import os
+import stat
+import sys
+import tempfile
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Union, Any
+
+# orjson is optional; it serializes and parses faster than the stdlib json module.
+# The backend is picked once here so the config I/O helpers don't branch per call.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    _json_loads = orjson.loads
+
+    def _json_bytes(data: Any) -> bytes:
+        """Serialize data as indented JSON bytes"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+else:
+    _json_loads = json.loads
+
+    def _json_bytes(data: Any) -> bytes:
+        """Serialize data as indented JSON bytes"""
+        return json.dumps(data, indent=2).encode('utf-8')
+
+# dataclass(slots=True) needs Python 3.10; older interpreters get regular instance dicts
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 BASE_DIR = Path(__file__).resolve().parent
 CONFIG_DIR = BASE_DIR / "config"
 
-@dataclass 
+def _config_dict(config: Any) -> Dict[str, Any]:
+    """Serializable fields of a config dataclass (slotted dataclasses have no __dict__)"""
+    return {f.name: getattr(config, f.name) for f in fields(config) if f.init}
+
+def _current_umask() -> int:
+    """The process umask (os.umask can only be read by setting it)"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+def _read_json(path: Path) -> Any:
+    """Read a JSON file in one bytes read (both backends parse bytes directly)"""
+    return _json_loads(Path(path).read_bytes())
+
+@dataclass(**_DATACLASS_SLOTS)
 class ColumnConfig:
     """Configuration for column mappings"""
     headers: List[str] = field(default_factory=list)
@@ -27,11 +72,136 @@ class ColumnConfig:
     teleop_columns: List[str] = field(default_factory=list)
     endgame_columns: List[str] = field(default_factory=list)
 
-@dataclass
+_DEFAULT_PHASE_WEIGHTS = (0.25, 0.35, 0.40)
+_DEFAULT_PHASE_NAMES = ("Early Season", "Mid Season", "Late Season")
+
+@dataclass(**_DATACLASS_SLOTS)
 class RobotValuationConfig:
     """Configuration for robot valuation weights"""
-    phase_weights: List[float] = field(default_factory=lambda: [0.25, 0.35, 0.40])  # Early, Mid, Late season emphasis
-    phase_names: List[str] = field(default_factory=lambda: ["Early Season", "Mid Season", "Late Season"])
+    phase_weights: List[float] = field(default_factory=lambda: list(_DEFAULT_PHASE_WEIGHTS))  # Early, Mid, Late season emphasis
+    phase_names: List[str] = field(default_factory=lambda: list(_DEFAULT_PHASE_NAMES))
+
+# Header sets that identify each CSV format in detect_csv_format
+_NEW_FORMAT_INDICATORS = frozenset({
+    "Scouter Initials", "Coral L1 (Auto)", "Coral L1 (Teleop)",
+    "End Position", "Starting Position"
+})
+_LEGACY_FORMAT_INDICATORS = frozenset({
+    "Lead Scouter", "Did something?", "Coral L1 Scored", "Climbed?"
+})
+
+def _count_indicators(indicators: frozenset, headers: set, needed: int) -> int:
+    """Count indicator headers present, stopping once `needed` have been found"""
+    found = 0
+    for indicator in indicators:
+        if indicator in headers:
+            found += 1
+            if found >= needed:
+                break
+    return found
+
+@lru_cache(maxsize=32)
+def _detect_csv_format(headers: tuple) -> str:
+    """Format detection behind ConfigManager.detect_csv_format"""
+    headers_set = set(headers)
+    
+    # Check for new format indicators
+    if _count_indicators(_NEW_FORMAT_INDICATORS, headers_set, 3) >= 3:
+        return "new_format"
+    
+    # Check for legacy format indicators
+    if _count_indicators(_LEGACY_FORMAT_INDICATORS, headers_set, 2) >= 2:
+        return "legacy_format"
+    
+    return "unknown_format"
+
+# Preset column lists, shared read-only by every ConfigManager
+_NEW_STANDARD_HEADERS = (
+    "Scouter Initials", "Match Number", "Robot", "Future Alliance", "Team Number", "Starting Position",
+    "No Show", "Moved (Auto)", "Coral L1 (Auto)", "Coral L2 (Auto)", "Coral L3 (Auto)", "Coral L4 (Auto)",
+    "Barge Algae (Auto)", "Processor Algae (Auto)", "Dislodged Algae (Auto)", "Foul (Auto)",
+    "Dislodged Algae (Teleop)", "Pickup Location", "Coral L1 (Teleop)", "Coral L2 (Teleop)",
+    "Coral L3 (Teleop)", "Coral L4 (Teleop)", "Barge Algae (Teleop)", "Processor Algae (Teleop)",
+    "Crossed Field/Defense", "Tipped/Fell", "Touched Opposing Cage", "Died", "End Position", "Broke",
+    "Defended", "Coral HP Mistake", "Yellow/Red Card"
+)
+_NEW_STANDARD_CORAL_AUTO = ("Coral L1 (Auto)", "Coral L2 (Auto)", "Coral L3 (Auto)", "Coral L4 (Auto)")
+_NEW_STANDARD_CORAL_TELEOP = ("Coral L1 (Teleop)", "Coral L2 (Teleop)", "Coral L3 (Teleop)", "Coral L4 (Teleop)")
+_NEW_STANDARD_NUMERIC_FOR_OVERALL = (
+    *_NEW_STANDARD_CORAL_AUTO, *_NEW_STANDARD_CORAL_TELEOP,
+    "Barge Algae (Auto)", "Barge Algae (Teleop)", "Processor Algae (Auto)", "Processor Algae (Teleop)"
+)
+# Stats cover every scoring column plus the endgame/defense outcomes
+_NEW_STANDARD_STATS_COLUMNS = (
+    *_NEW_STANDARD_NUMERIC_FOR_OVERALL, "End Position", "Crossed Field/Defense", "Died"
+)
+_NEW_STANDARD_MODE_BOOLEAN_COLUMNS = (
+    "Moved (Auto)", "Foul (Auto)", "Crossed Field/Defense", "Died", "Broke", "Defended"
+)
+_NEW_STANDARD_AUTONOMOUS_COLUMNS = (
+    "Moved (Auto)", *_NEW_STANDARD_CORAL_AUTO, "Barge Algae (Auto)", "Processor Algae (Auto)", "Foul (Auto)"
+)
+_NEW_STANDARD_TELEOP_COLUMNS = (
+    *_NEW_STANDARD_CORAL_TELEOP, "Barge Algae (Teleop)", "Processor Algae (Teleop)", "Crossed Field/Defense",
+    "Dislodged Algae (Teleop)", "Defended"
+)
+_NEW_STANDARD_ENDGAME_COLUMNS = (
+    "End Position", "Died", "Broke", "Tipped/Fell"
+)
+
+_LEGACY_HEADERS = (
+    "Lead Scouter", "Highlights Scouter Name", "Scouter Name", "Match Number", "Future Alliance in Qualy?",
+    "Team Number", "Did something?", "Did Foul?", "Did auton worked?", "Coral L1 Scored", "Coral L2 Scored",
+    "Coral L3 Scored", "Coral L4 Scored", "Played Algae?(Disloged NO COUNT)", "Algae Scored in Barge",
+    "Crossed Feild/Played Defense?", "Tipped/Fell Over?", "Died?", "Was the robot Defended by someone?",
+    "Yellow/Red Card", "Climbed?"
+)
+_LEGACY_NUMERIC_FOR_OVERALL = (
+    "Coral L1 Scored", "Coral L2 Scored", "Coral L3 Scored", "Coral L4 Scored", "Climbed?"
+)
+_LEGACY_STATS_COLUMNS = (
+    "Was the robot Defended by someone?", "Yellow/Red Card", "Climbed?"
+)
+_LEGACY_MODE_BOOLEAN_COLUMNS = ()
+_LEGACY_AUTONOMOUS_COLUMNS = (
+    "Did something?", "Did Foul?", "Did auton worked?"
+)
+_LEGACY_TELEOP_COLUMNS = (
+    "Coral L1 Scored", "Coral L2 Scored", "Coral L3 Scored", "Coral L4 Scored", "Algae Scored in Barge",
+    "Crossed Feild/Played Defense?"
+)
+_LEGACY_ENDGAME_COLUMNS = (
+    "Climbed?", "Tipped/Fell Over?", "Died?"
+)
+
+_PRESET_DEFINITIONS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "new_standard": MappingProxyType({
+        "name": "New Standard Format (2025)",
+        "description": "Format with separate Auto/Teleop columns",
+        "column_config": MappingProxyType({
+            "headers": _NEW_STANDARD_HEADERS,
+            "numeric_for_overall": _NEW_STANDARD_NUMERIC_FOR_OVERALL,
+            "stats_columns": _NEW_STANDARD_STATS_COLUMNS,
+            "mode_boolean_columns": _NEW_STANDARD_MODE_BOOLEAN_COLUMNS,
+            "autonomous_columns": _NEW_STANDARD_AUTONOMOUS_COLUMNS,
+            "teleop_columns": _NEW_STANDARD_TELEOP_COLUMNS,
+            "endgame_columns": _NEW_STANDARD_ENDGAME_COLUMNS
+        })
+    }),
+    "legacy": MappingProxyType({
+        "name": "Legacy Format",
+        "description": "Old format with combined columns",
+        "column_config": MappingProxyType({
+            "headers": _LEGACY_HEADERS,
+            "numeric_for_overall": _LEGACY_NUMERIC_FOR_OVERALL,
+            "stats_columns": _LEGACY_STATS_COLUMNS,
+            "mode_boolean_columns": _LEGACY_MODE_BOOLEAN_COLUMNS,
+            "autonomous_columns": _LEGACY_AUTONOMOUS_COLUMNS,
+            "teleop_columns": _LEGACY_TELEOP_COLUMNS,
+            "endgame_columns": _LEGACY_ENDGAME_COLUMNS
+        })
+    })
+})
 
 class ConfigManager:
     """Manages configuration presets and format detection"""
@@ -41,122 +211,74 @@ class ConfigManager:
         if not resolved_path.is_absolute():
             resolved_path = BASE_DIR / resolved_path
         self.config_file = resolved_path
-        self.presets = self._load_presets()
+        # Presets are built on first use; format detection never needs them
+        self._presets_cache: Dict[str, Dict] = {}
     
-    def _load_presets(self) -> Dict:
-        """Load configuration presets"""
-        return {
-            "new_standard": {
-                "name": "New Standard Format (2025)",
-                "description": "Format with separate Auto/Teleop columns",
-                "column_config": ColumnConfig(
-                    headers=[
-                        "Scouter Initials", "Match Number", "Robot", "Future Alliance", "Team Number",
-                        "Starting Position", "No Show", "Moved (Auto)", "Coral L1 (Auto)", "Coral L2 (Auto)",
-                        "Coral L3 (Auto)", "Coral L4 (Auto)", "Barge Algae (Auto)", "Processor Algae (Auto)",
-                        "Dislodged Algae (Auto)", "Foul (Auto)", "Dislodged Algae (Teleop)", "Pickup Location",
-                        "Coral L1 (Teleop)", "Coral L2 (Teleop)", "Coral L3 (Teleop)", "Coral L4 (Teleop)",
-                        "Barge Algae (Teleop)", "Processor Algae (Teleop)", "Crossed Field/Defense",
-                        "Tipped/Fell", "Touched Opposing Cage", "Died", "End Position", "Broke", "Defended",
-                        "Coral HP Mistake", "Yellow/Red Card"
-                    ],
-                    numeric_for_overall=[
-                        "Coral L1 (Auto)", "Coral L2 (Auto)", "Coral L3 (Auto)", "Coral L4 (Auto)",
-                        "Coral L1 (Teleop)", "Coral L2 (Teleop)", "Coral L3 (Teleop)", "Coral L4 (Teleop)",
-                        "Barge Algae (Auto)", "Barge Algae (Teleop)", "Processor Algae (Auto)", "Processor Algae (Teleop)"
-                    ],
-                    stats_columns=[
-                        "Coral L1 (Auto)", "Coral L2 (Auto)", "Coral L3 (Auto)", "Coral L4 (Auto)",
-                        "Coral L1 (Teleop)", "Coral L2 (Teleop)", "Coral L3 (Teleop)", "Coral L4 (Teleop)",
-                        "Barge Algae (Auto)", "Barge Algae (Teleop)", "Processor Algae (Auto)", "Processor Algae (Teleop)",
-                        "End Position", "Crossed Field/Defense", "Died"
-                    ],
-                    mode_boolean_columns=[
-                        "Moved (Auto)", "Foul (Auto)", "Crossed Field/Defense", "Died", "Broke", "Defended"
-                    ],
-                    autonomous_columns=[
-                        "Moved (Auto)", "Coral L1 (Auto)", "Coral L2 (Auto)", "Coral L3 (Auto)", "Coral L4 (Auto)",
-                        "Barge Algae (Auto)", "Processor Algae (Auto)", "Foul (Auto)"
-                    ],
-                    teleop_columns=[
-                        "Coral L1 (Teleop)", "Coral L2 (Teleop)", "Coral L3 (Teleop)", "Coral L4 (Teleop)",
-                        "Barge Algae (Teleop)", "Processor Algae (Teleop)", "Crossed Field/Defense",
-                        "Dislodged Algae (Teleop)", "Defended"
-                    ],
-                    endgame_columns=[
-                        "End Position", "Died", "Broke", "Tipped/Fell"
-                    ]
-                ),
-                "robot_valuation": RobotValuationConfig()
-            },
-            "legacy": {
-                "name": "Legacy Format",
-                "description": "Old format with combined columns",
-                "column_config": ColumnConfig(
-                    headers=[
-                        "Lead Scouter", "Highlights Scouter Name", "Scouter Name", "Match Number",
-                        "Future Alliance in Qualy?", "Team Number", "Did something?", "Did Foul?", 
-                        "Did auton worked?", "Coral L1 Scored", "Coral L2 Scored", "Coral L3 Scored", 
-                        "Coral L4 Scored", "Played Algae?(Disloged NO COUNT)", "Algae Scored in Barge",
-                        "Crossed Feild/Played Defense?", "Tipped/Fell Over?", "Died?", 
-                        "Was the robot Defended by someone?", "Yellow/Red Card", "Climbed?"
-                    ],
-                    numeric_for_overall=[
-                        "Coral L1 Scored", "Coral L2 Scored", "Coral L3 Scored", "Coral L4 Scored", "Climbed?"
-                    ],
-                    stats_columns=[
-                        "Was the robot Defended by someone?", "Yellow/Red Card", "Climbed?"
-                    ],
-                    mode_boolean_columns=[],
-                    autonomous_columns=[
-                        "Did something?", "Did Foul?", "Did auton worked?"
-                    ],
-                    teleop_columns=[
-                        "Coral L1 Scored", "Coral L2 Scored", "Coral L3 Scored", "Coral L4 Scored",
-                        "Algae Scored in Barge", "Crossed Feild/Played Defense?"
-                    ],
-                    endgame_columns=[
-                        "Climbed?", "Tipped/Fell Over?", "Died?"
-                    ]
-                ),
+    def _write_config(self, config: Dict) -> None:
+        """Write config to config_file, skipping the write if the file already holds it"""
+        payload = _json_bytes(config)
+        # Write through symlinks so a linked config keeps pointing at the shared file
+        target = Path(os.path.realpath(self.config_file))
+        try:
+            if target.read_bytes() == payload:
+                return
+            mode = stat.S_IMODE(target.stat().st_mode)
+        except OSError:
+            mode = 0o666 & ~_current_umask()
+        # Write to a unique sibling temp file and swap it in, so readers never see a
+        # partial file and concurrent writers don't clobber each other's temp file.
+        # The temp file is created 0600, so give it the config's permissions first
+        with tempfile.NamedTemporaryFile(
+            dir=target.parent, prefix=target.name + ".", suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(payload)
+        try:
+            os.chmod(tmp.name, mode)
+            os.replace(tmp.name, target)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+    
+    @property
+    def presets(self) -> Dict:
+        """All presets, building any that haven't been used yet"""
+        if len(self._presets_cache) != len(_PRESET_DEFINITIONS):
+            self._presets_cache = {name: self._get_preset(name) for name in _PRESET_DEFINITIONS}
+        return self._presets_cache
+    
+    def _get_preset(self, preset_name: str) -> Dict:
+        """Build (once) and return a single preset"""
+        preset = self._presets_cache.get(preset_name)
+        if preset is None:
+            definition = _PRESET_DEFINITIONS[preset_name]
+            # Each manager gets its own mutable copies, since update_column_config edits them in place
+            preset = {
+                "name": definition["name"],
+                "description": definition["description"],
+                "column_config": ColumnConfig(**{
+                    key: list(columns) for key, columns in definition["column_config"].items()
+                }),
                 "robot_valuation": RobotValuationConfig()
             }
-        }
+            self._presets_cache[preset_name] = preset
+        return preset
     
     def detect_csv_format(self, headers: List[str]) -> str:
         """Detect CSV format based on headers"""
-        headers_set = set(headers)
-        
-        # Check for new format indicators
-        new_format_indicators = {
-            "Scouter Initials", "Coral L1 (Auto)", "Coral L1 (Teleop)", 
-            "End Position", "Starting Position"
-        }
-        
-        if len(new_format_indicators.intersection(headers_set)) >= 3:
-            return "new_format"
-        
-        # Check for legacy format indicators  
-        legacy_indicators = {
-            "Lead Scouter", "Did something?", "Coral L1 Scored", "Climbed?"
-        }
-        
-        if len(legacy_indicators.intersection(headers_set)) >= 2:
-            return "legacy_format"
-        
-        return "unknown_format"
+        # The same header row recurs across files and refreshes, so results are cached by it
+        return _detect_csv_format(tuple(headers))
     
     def get_column_config(self, format_name: str = "new_standard") -> ColumnConfig:
         """Get column configuration for specified format"""
-        if format_name in self.presets:
-            return self.presets[format_name]["column_config"]
-        return self.presets["new_standard"]["column_config"]
+        if format_name not in _PRESET_DEFINITIONS:
+            format_name = "new_standard"
+        return self._get_preset(format_name)["column_config"]
     
     def get_robot_valuation_config(self, format_name: str = "new_standard") -> RobotValuationConfig:
         """Get robot valuation configuration"""
-        if format_name in self.presets:
-            return self.presets[format_name]["robot_valuation"]
-        return self.presets["new_standard"]["robot_valuation"]
+        if format_name not in _PRESET_DEFINITIONS:
+            format_name = "new_standard"
+        return self._get_preset(format_name)["robot_valuation"]
     
     def get_configuration_presets(self) -> Dict:
         """Get all available presets"""
@@ -164,19 +286,18 @@ class ConfigManager:
     
     def apply_preset(self, preset_name: str) -> bool:
         """Apply a configuration preset"""
-        if preset_name not in self.presets:
+        if preset_name not in _PRESET_DEFINITIONS:
             return False
         
         # Save current configuration
         try:
             config = {
                 "active_preset": preset_name,
-                "column_config": self.presets[preset_name]["column_config"].__dict__,
-                "robot_valuation": self.presets[preset_name]["robot_valuation"].__dict__
+                "column_config": _config_dict(self._get_preset(preset_name)["column_config"]),
+                "robot_valuation": _config_dict(self._get_preset(preset_name)["robot_valuation"])
             }
             
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            self._write_config(config)
             
             return True
         except Exception as e:
@@ -185,16 +306,16 @@ class ConfigManager:
     
     def update_column_config(self, **kwargs) -> None:
         """Update column configuration with provided values."""
-        if "new_standard" in self.presets:
-            config = self.presets["new_standard"]["column_config"]
+        if "new_standard" in _PRESET_DEFINITIONS:
+            config = self._get_preset("new_standard")["column_config"]
             for key, value in kwargs.items():
                 if hasattr(config, key):
                     setattr(config, key, value)
     
     def update_robot_valuation_config(self, **kwargs) -> None:
         """Update robot valuation configuration with provided values."""
-        if "new_standard" in self.presets:
-            config = self.presets["new_standard"]["robot_valuation"]
+        if "new_standard" in _PRESET_DEFINITIONS:
+            config = self._get_preset("new_standard")["robot_valuation"]
             for key, value in kwargs.items():
                 if hasattr(config, key):
                     setattr(config, key, value)
@@ -202,14 +323,14 @@ class ConfigManager:
     def save_configuration(self) -> bool:
         """Save current configuration to file."""
         try:
-            if "new_standard" in self.presets:
+            if "new_standard" in _PRESET_DEFINITIONS:
+                preset = self._get_preset("new_standard")
                 config = {
                     "active_preset": "new_standard",
-                    "column_config": self.presets["new_standard"]["column_config"].__dict__,
-                    "robot_valuation": self.presets["new_standard"]["robot_valuation"].__dict__
+                    "column_config": _config_dict(preset["column_config"]),
+                    "robot_valuation": _config_dict(preset["robot_valuation"])
                 }
-                with open(self.config_file, 'w') as f:
-                    json.dump(config, f, indent=2)
+                self._write_config(config)
                 return True
         except Exception as e:
             print(f"Error saving configuration: {e}")
@@ -218,131 +339,139 @@ class ConfigManager:
 
 # ==================== Extended Configuration Classes ==================== #
 
-@dataclass
+_DEFAULT_HONOR_ROLL_WEIGHTS = MappingProxyType({
+    "match_performance": 0.50,
+    "pit_scouting": 0.30,
+    "during_event": 0.20
+})
+_DEFAULT_MATCH_PERFORMANCE_WEIGHTS = MappingProxyType({
+    "autonomous": 0.20,
+    "teleop": 0.60,
+    "endgame": 0.20
+})
+_DEFAULT_PIT_SCOUTING_WEIGHTS = MappingProxyType({
+    "electrical": 0.3333,
+    "mechanical": 0.25,
+    "driver_station_layout": 0.1667,
+    "tools": 0.1667,
+    "spare_parts": 0.0833
+})
+_DEFAULT_DURING_EVENT_WEIGHTS = MappingProxyType({
+    "team_organization": 0.50,
+    "collaboration": 0.50
+})
+_DEFAULT_COMPETENCY_MULTIPLIERS = MappingProxyType({
+    "competencies": 6,
+    "subcompetencies": 3,
+    "behavior_reports": 0
+})
+_DEFAULT_DISQUALIFICATION_THRESHOLDS = MappingProxyType({
+    "min_competencies": 2,
+    "min_subcompetencies": 1,
+    "min_honor_roll_score": 70.0
+})
+
+@dataclass(**_DATACLASS_SLOTS)
 class ScoringConfig:
     """Configuration for Honor Roll scoring weights and thresholds."""
-    honor_roll_weights: Dict[str, float] = field(default_factory=lambda: {
-        "match_performance": 0.50,
-        "pit_scouting": 0.30,
-        "during_event": 0.20
-    })
-    match_performance_weights: Dict[str, float] = field(default_factory=lambda: {
-        "autonomous": 0.20,
-        "teleop": 0.60,
-        "endgame": 0.20
-    })
-    pit_scouting_weights: Dict[str, float] = field(default_factory=lambda: {
-        "electrical": 0.3333,
-        "mechanical": 0.25,
-        "driver_station_layout": 0.1667,
-        "tools": 0.1667,
-        "spare_parts": 0.0833
-    })
-    during_event_weights: Dict[str, float] = field(default_factory=lambda: {
-        "team_organization": 0.50,
-        "collaboration": 0.50
-    })
-    competency_multipliers: Dict[str, int] = field(default_factory=lambda: {
-        "competencies": 6,
-        "subcompetencies": 3,
-        "behavior_reports": 0
-    })
-    disqualification_thresholds: Dict[str, Any] = field(default_factory=lambda: {
-        "min_competencies": 2,
-        "min_subcompetencies": 1,
-        "min_honor_roll_score": 70.0
-    })
+    honor_roll_weights: Dict[str, float] = field(default_factory=lambda: dict(_DEFAULT_HONOR_ROLL_WEIGHTS))
+    match_performance_weights: Dict[str, float] = field(default_factory=lambda: dict(_DEFAULT_MATCH_PERFORMANCE_WEIGHTS))
+    pit_scouting_weights: Dict[str, float] = field(default_factory=lambda: dict(_DEFAULT_PIT_SCOUTING_WEIGHTS))
+    during_event_weights: Dict[str, float] = field(default_factory=lambda: dict(_DEFAULT_DURING_EVENT_WEIGHTS))
+    competency_multipliers: Dict[str, int] = field(default_factory=lambda: dict(_DEFAULT_COMPETENCY_MULTIPLIERS))
+    disqualification_thresholds: Dict[str, Any] = field(default_factory=lambda: dict(_DEFAULT_DISQUALIFICATION_THRESHOLDS))
 
 
-@dataclass
+_DEFAULT_DRAFT_PARAMETERS = MappingProxyType({
+    "max_alliances": 8,
+    "teams_per_alliance": 3,
+    "min_teams_per_alliance_for_calc": 3
+})
+_DEFAULT_SCORING_WEIGHTS = MappingProxyType({
+    "auto": 1.5,
+    "teleop": 1.0,
+    "endgame": 1.2,
+    "defense": 12,
+    "consistency": 5,
+    "clutch": 8
+})
+_DEFAULT_PICK2_PRIORITIES = (
+    "defense_rate",
+    "algae_score",
+    "death_rate"
+)
+_DEFAULT_RECOMMENDATION_LOGIC = MappingProxyType({
+    "pick1": "captain_sniping",
+    "pick2": "best_available_with_priorities"
+})
+
+@dataclass(**_DATACLASS_SLOTS)
 class AllianceConfig:
     """Configuration for alliance selection parameters."""
-    draft_parameters: Dict[str, Any] = field(default_factory=lambda: {
-        "max_alliances": 8,
-        "teams_per_alliance": 3,
-        "min_teams_per_alliance_for_calc": 3
-    })
-    scoring_weights: Dict[str, float] = field(default_factory=lambda: {
-        "auto": 1.5,
-        "teleop": 1.0,
-        "endgame": 1.2,
-        "defense": 12,
-        "consistency": 5,
-        "clutch": 8
-    })
-    pick2_priorities: List[str] = field(default_factory=lambda: [
-        "defense_rate",
-        "algae_score",
-        "death_rate"
-    ])
-    recommendation_logic: Dict[str, str] = field(default_factory=lambda: {
-        "pick1": "captain_sniping",
-        "pick2": "best_available_with_priorities"
-    })
+    draft_parameters: Dict[str, Any] = field(default_factory=lambda: dict(_DEFAULT_DRAFT_PARAMETERS))
+    scoring_weights: Dict[str, float] = field(default_factory=lambda: dict(_DEFAULT_SCORING_WEIGHTS))
+    pick2_priorities: List[str] = field(default_factory=lambda: list(_DEFAULT_PICK2_PRIORITIES))
+    recommendation_logic: Dict[str, str] = field(default_factory=lambda: dict(_DEFAULT_RECOMMENDATION_LOGIC))
+
 
+_DEFAULT_CORAL_AUTO_POINTS = MappingProxyType({
+    "L1": 3, "L2": 4, "L3": 6, "L4": 7
+})
+_DEFAULT_CORAL_TELEOP_POINTS = MappingProxyType({
+    "L1": 2, "L2": 3, "L3": 4, "L4": 5
+})
+_DEFAULT_ALGAE_POINTS = MappingProxyType({
+    "processor": 6,
+    "processor_opponent_bonus": 4,
+    "net": 4
+})
+_DEFAULT_CLIMB_POINTS = MappingProxyType({
+    "none": 0, "park": 2, "shallow": 6, "deep": 12
+})
+_DEFAULT_RANKING_POINTS = MappingProxyType({
+    "win": 3,
+    "tie": 1,
+    "loss": 0
+})
+_DEFAULT_AUTO_RP_REQUIREMENTS = MappingProxyType({
+    "all_leave_zone": True,
+    "min_coral_auto": 1
+})
+_DEFAULT_CORAL_RP_REQUIREMENTS = MappingProxyType({
+    "min_coral_per_level_no_coop": 7,
+    "min_levels_with_coop": 3,
+    "min_coral_per_level_with_coop": 7
+})
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class GameConfig:
     """Configuration for game point values (FRC 2025 REEFSCAPE)."""
     game_name: str = "REEFSCAPE 2025"
-    coral_auto_points: Dict[str, int] = field(default_factory=lambda: {
-        "L1": 3, "L2": 4, "L3": 6, "L4": 7
-    })
-    coral_teleop_points: Dict[str, int] = field(default_factory=lambda: {
-        "L1": 2, "L2": 3, "L3": 4, "L4": 5
-    })
-    algae_points: Dict[str, int] = field(default_factory=lambda: {
-        "processor": 6,
-        "processor_opponent_bonus": 4,
-        "net": 4
-    })
-    climb_points: Dict[str, int] = field(default_factory=lambda: {
-        "none": 0, "park": 2, "shallow": 6, "deep": 12
-    })
-    ranking_points: Dict[str, Any] = field(default_factory=lambda: {
-        "win": 3,
-        "tie": 1,
-        "loss": 0
-    })
-    auto_rp_requirements: Dict[str, Any] = field(default_factory=lambda: {
-        "all_leave_zone": True,
-        "min_coral_auto": 1
-    })
-    coral_rp_requirements: Dict[str, Any] = field(default_factory=lambda: {
-        "min_coral_per_level_no_coop": 7,
-        "min_levels_with_coop": 3,
-        "min_coral_per_level_with_coop": 7
-    })
+    coral_auto_points: Dict[str, int] = field(default_factory=lambda: dict(_DEFAULT_CORAL_AUTO_POINTS))
+    coral_teleop_points: Dict[str, int] = field(default_factory=lambda: dict(_DEFAULT_CORAL_TELEOP_POINTS))
+    algae_points: Dict[str, int] = field(default_factory=lambda: dict(_DEFAULT_ALGAE_POINTS))
+    climb_points: Dict[str, int] = field(default_factory=lambda: dict(_DEFAULT_CLIMB_POINTS))
+    ranking_points: Dict[str, Any] = field(default_factory=lambda: dict(_DEFAULT_RANKING_POINTS))
+    auto_rp_requirements: Dict[str, Any] = field(default_factory=lambda: dict(_DEFAULT_AUTO_RP_REQUIREMENTS))
+    coral_rp_requirements: Dict[str, Any] = field(default_factory=lambda: dict(_DEFAULT_CORAL_RP_REQUIREMENTS))
     cooperation_threshold: int = 2
 
 
 import threading
 
+# Parsed config files keyed by (path, mtime); callers get deep copies since the config dataclasses are mutable
+_JSON_CACHE: Dict[tuple, Any] = {}
+_JSON_CACHE_LOCK = threading.Lock()
+
 
 class GlobalConfigManager:
     """
-    Singleton configuration manager that loads all JSON configuration files.
+    Configuration manager that loads all JSON configuration files.
     Provides a unified API for accessing configuration across the application.
-    Thread-safe implementation using a lock.
+    Use get_global_config() to get the shared instance.
     """
     
-    _instance: Optional['GlobalConfigManager'] = None
-    _lock: threading.Lock = threading.Lock()
-    
-    def __new__(cls) -> 'GlobalConfigManager':
-        if cls._instance is None:
-            with cls._lock:
-                # Double-check locking pattern for thread safety
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
-    
     def __init__(self):
-        if self._initialized:
-            return
-        
-        self._initialized = True
         self._scoring_config: Optional[ScoringConfig] = None
         self._alliance_config: Optional[AllianceConfig] = None
         self._game_config: Optional[GameConfig] = None
@@ -364,13 +493,24 @@ class GlobalConfigManager:
             # Fallback to lib directory
             config_path = BASE_DIR / filename
         
-        if config_path.exists():
+        try:
+            cache_key = (str(config_path), config_path.stat().st_mtime_ns)
+        except OSError:
+            return None
+        
+        with _JSON_CACHE_LOCK:
+            if cache_key in _JSON_CACHE:
+                return copy.deepcopy(_JSON_CACHE[cache_key])
             try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                data = _read_json(config_path)
             except Exception as e:
                 print(f"Error loading {filename}: {e}")
-        return None
+                return None
+            # Drop entries for older versions of the same file
+            for stale_key in [key for key in _JSON_CACHE if key[0] == cache_key[0]]:
+                del _JSON_CACHE[stale_key]
+            _JSON_CACHE[cache_key] = data
+            return copy.deepcopy(data)
     
     def _load_scoring_config(self) -> ScoringConfig:
         """Load scoring configuration."""
@@ -452,10 +592,11 @@ class GlobalConfigManager:
     
     @classmethod
     def reset_instance(cls) -> None:
-        """Reset the singleton instance (useful for testing)."""
-        cls._instance = None
+        """Reset the shared instance (useful for testing)."""
+        get_global_config.cache_clear()
 
 
+@lru_cache(maxsize=1)
 def get_global_config() -> GlobalConfigManager:
     """Get the global configuration manager instance."""
     return GlobalConfigManager()
\ No newline at end of file
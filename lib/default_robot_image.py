@@ -4,12 +4,24 @@ Create a default robot image for tier list export
 """
 
 from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
 import base64
 import io
 import os
 
-def create_default_robot_image(team_number, size=(150, 150)):
-    """Create a default robot image with team number"""
+@lru_cache(maxsize=8)
+def _load_font(font_size):
+    """Load the team number font once per size"""
+    try:
+        # Try to use a nice font
+        return ImageFont.truetype("arial.ttf", font_size)
+    except:
+        # Fallback to default font
+        return ImageFont.load_default()
+
+@lru_cache(maxsize=8)
+def _robot_template(size):
+    """Draw the robot (everything except the team number) once per size"""
     # Create a new image with a robot-like background
     img = Image.new('RGB', size, color='#2E3440')  # Dark background
     draw = ImageDraw.Draw(img)
@@ -56,14 +68,20 @@ def create_default_robot_image(team_number, size=(150, 150)):
     draw.rectangle([right_arm_x, arm_y, right_arm_x + arm_width, arm_y + arm_height], 
                   fill='#5E81AC', outline='#88C0D0', width=1)
     
+    return img
+
+def create_default_robot_image(team_number, size=(150, 150)):
+    """Create a default robot image with team number"""
+    size = tuple(size)
+    img = _robot_template(size).copy()
+    draw = ImageDraw.Draw(img)
+    
+    # Same body placement as the template
+    body_height = size[1] * 0.4
+    body_y = size[1] * 0.35
+    
     # Team number text
-    try:
-        # Try to use a nice font
-        font_size = max(16, size[0] // 8)
-        font = ImageFont.truetype("arial.ttf", font_size)
-    except:
-        # Fallback to default font
-        font = ImageFont.load_default()
+    font = _load_font(max(16, size[0] // 8))
     
     # Get text dimensions
     text = str(team_number)
@@ -82,28 +100,57 @@ def create_default_robot_image(team_number, size=(150, 150)):
 def image_to_base64(img):
     """Convert PIL Image to base64 string"""
     buffer = io.BytesIO()
-    img.save(buffer, format='PNG')
-    img_data = buffer.getvalue()
-    return base64.b64encode(img_data).decode('utf-8')
+    # Thumbnails are small; fast zlib matters more than the last few bytes
+    img.save(buffer, format='PNG', compress_level=1)
+    return base64.b64encode(buffer.getbuffer()).decode('ascii')
+
+_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp')
+
+@lru_cache(maxsize=8)
+def _index_images(images_folder, folder_mtime_ns):
+    """Map team number -> image paths (in _IMAGE_EXTENSIONS order) with one directory scan"""
+    found = {}
+    with os.scandir(images_folder) as entries:
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            # Case-insensitive, so 7421.PNG from a camera matches like 7421.png
+            ext = ext.lower()
+            if ext in _IMAGE_EXTENSIONS:
+                found.setdefault(stem, []).append((_IMAGE_EXTENSIONS.index(ext), entry.path))
+    return {stem: tuple(path for _, path in sorted(paths)) for stem, paths in found.items()}
 
 def load_team_image(team_number, images_folder=None):
     """Load team image from folder or create default"""
-    if images_folder and os.path.exists(images_folder):
-        # Look for image files with team number
-        for ext in ['.png', '.jpg', '.jpeg', '.gif', '.bmp']:
-            img_path = os.path.join(images_folder, f"{team_number}{ext}")
-            if os.path.exists(img_path):
-                try:
-                    img = Image.open(img_path)
-                    # Resize to standard size
-                    img = img.resize((150, 150), Image.Resampling.LANCZOS)
-                    return image_to_base64(img)
-                except Exception as e:
-                    print(f"Error loading image for team {team_number}: {e}")
+    if images_folder and os.path.isdir(images_folder):
+        # Look for image files with team number; the folder mtime changes when files are added or removed
+        index = _index_images(images_folder, os.stat(images_folder).st_mtime_ns)
+        for img_path in index.get(str(team_number), ()):
+            try:
+                # Keyed on mtime so a replaced image is picked up
+                return _file_image_base64(img_path, os.stat(img_path).st_mtime_ns)
+            except Exception as e:
+                print(f"Error loading image for team {team_number}: {e}")
     
     # Create default image
-    default_img = create_default_robot_image(team_number)
-    return image_to_base64(default_img)
+    return _default_image_base64(str(team_number))
+
+@lru_cache(maxsize=512)
+def _file_image_base64(img_path, mtime_ns):
+    """Encoded team image from disk, resized to the standard size"""
+    img = Image.open(img_path)
+    if img.mode == 'P':
+        # Palette images resize with nearest-neighbour; expand once, keeping transparency
+        img = img.convert('RGBA')
+    # Resize to standard size; LANCZOS only pays off for large downscales
+    if img.size != (150, 150):
+        resampler = Image.Resampling.LANCZOS if max(img.size) > 300 else Image.Resampling.BILINEAR
+        img = img.resize((150, 150), resampler)
+    return image_to_base64(img)
+
+@lru_cache(maxsize=512)
+def _default_image_base64(team_number):
+    """Encoded default image, built once per team number"""
+    return image_to_base64(create_default_robot_image(team_number))
 
 if __name__ == "__main__":
     # Test the function
@@ -12,6 +12,7 @@ import os
 import threading
 import time
 from collections import Counter, defaultdict
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime
 from pathlib import Path
@@ -25,6 +26,36 @@ ROOT_DIR = BASE_DIR.parent
 DATA_DIR = ROOT_DIR / "data"
 DEFAULT_CSV_PATH = DATA_DIR / "default_scouting.csv"
 
+# Boolean-like tokens recognised in scouting cells (lowercased)
+_BASIC_TRUE_LIKE = frozenset({'true', 'yes', 'y', '1'})
+_BASIC_FALSE_LIKE = frozenset({'false', 'no', 'n', '0'})
+_PHASE_TRUE_LIKE = _BASIC_TRUE_LIKE | {'si', 'sí'}
+_TRUE_LIKE = _PHASE_TRUE_LIKE | {'verdadero'}
+_FALSE_LIKE = _BASIC_FALSE_LIKE | {'falso'}
+
+
+def _parse_float(value: Any) -> Optional[float]:
+    """Convert a scouting cell to float, returning None for blank or non-numeric cells."""
+    if value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=256)
+def _end_position_points(value: str) -> int:
+    """Endgame points for a raw End Position cell; scouting data only has a handful of distinct values."""
+    end_pos = value.strip().lower()
+    if 'deep' in end_pos:
+        return 12
+    if 'shallow' in end_pos:
+        return 6
+    if 'park' in end_pos:
+        return 2
+    return 0
+
 
 class AnalizadorRobot:
     """
@@ -70,6 +101,11 @@ class AnalizadorRobot:
         if self.default_column_names:
             self.sheet_data.append(list(self.default_column_names))
 
+        # Rows grouped by team, built lazily and reset whenever sheet_data changes
+        self._team_rows_cache: Optional[Dict[str, List[List[str]]]] = None
+        # Bumped on every sheet_data change so dependent caches can detect stale results
+        self.data_version: int = 0
+
         # Column indices map for quick access
         self._column_indices: Dict[str, int] = {}
         self._update_column_indices()
@@ -100,6 +136,8 @@ class AnalizadorRobot:
     def _update_column_indices(self) -> None:
         """Update the column name to index mapping."""
         self._column_indices.clear()
+        self._team_rows_cache = None
+        self.data_version += 1
         if not self.sheet_data or not self.sheet_data[0]:
             if self.default_column_names:
                 for i, col_name in enumerate(self.default_column_names):
@@ -221,6 +259,8 @@ class AnalizadorRobot:
                 self.sheet_data = [list(self.default_column_names)]
             else:
                 self.sheet_data = []
+            self._team_rows_cache = None
+            self.data_version += 1
             
             # Reload the file
             self.load_csv(str(self._csv_file_path))
@@ -340,22 +380,14 @@ class AnalizadorRobot:
             """Parse a value to float, handling booleans and strings."""
             if isinstance(val, str):
                 val_lower = val.lower()
-                if val_lower in ['true', 'yes', 'y', '1', 'si', 'sí']:
+                if val_lower in _PHASE_TRUE_LIKE:
                     return 100.0
-                elif val_lower in ['false', 'no', 'n', '0']:
+                elif val_lower in _BASIC_FALSE_LIKE:
                     return 0.0
-                else:
-                    try:
-                        return float(val)
-                    except ValueError:
-                        return None
+                return _parse_float(val)
             elif isinstance(val, bool):
                 return 100.0 if val else 0.0
-            else:
-                try:
-                    return float(val)
-                except (ValueError, TypeError):
-                    return None
+            return _parse_float(val)
 
         def calculate_phase_score(columns: List[str]) -> float:
             """Calculate average score for a set of columns."""
@@ -600,14 +632,12 @@ class AnalizadorRobot:
 
     def _rate_from_strs(self, str_vals: List[str]) -> float:
         """Calculate rate from boolean string values."""
-        true_like = {'true', 'yes', 'y', '1', 'si', 'sí', 'verdadero'}
-        false_like = {'false', 'no', 'n', '0', 'falso'}
         bools = []
         for s in str_vals:
             lv = s.lower()
-            if lv in true_like:
+            if lv in _TRUE_LIKE:
                 bools.append(1.0)
-            elif lv in false_like:
+            elif lv in _FALSE_LIKE:
                 bools.append(0.0)
         return self._average(bools) if bools else 0.0
 
@@ -616,7 +646,13 @@ class AnalizadorRobot:
         return self.sheet_data
 
     def get_team_data_grouped(self) -> Dict[str, List[List[str]]]:
-        """Group rows by team number."""
+        """Group rows by team number (cached until the sheet data changes)."""
+        if self._team_rows_cache is None:
+            self._team_rows_cache = self._group_rows_by_team()
+        return dict(self._team_rows_cache)
+
+    def _group_rows_by_team(self) -> Dict[str, List[List[str]]]:
+        """Build the team number -> rows map in a single pass over sheet_data."""
         if len(self.sheet_data) < 2:
             return {}
         team_number_col_name = "Team Number"
@@ -691,150 +727,89 @@ class AnalizadorRobot:
             ]
         }
         
+        # Resolve column indices once; they are the same for every team
+        column_indices = self._column_indices
+        group_indices = [
+            (self._generate_stat_key(group_name, 'avg'),
+             self._generate_stat_key(group_name, 'std'),
+             [column_indices[col] for col in columns if col in column_indices])
+            for group_name, columns in coral_algae_groups.items()
+        ]
+        individual_numeric_columns = []
+        for columns in coral_algae_groups.values():
+            individual_numeric_columns.extend(columns)
+        individual_numeric_columns = list(set(individual_numeric_columns))
+        individual_indices = [
+            (self._generate_stat_key(col_name, 'avg'),
+             self._generate_stat_key(col_name, 'std'),
+             column_indices[col_name])
+            for col_name in individual_numeric_columns if col_name in column_indices
+        ]
+        numeric_indices = {col_idx for _, _, col_idx in individual_indices}
+        
+        defense_col = 'Crossed Field/Defense'
+        defense_idx = column_indices.get(defense_col)
+        if defense_idx is None:
+            defense_col = 'Crossed Feild/Played Defense?'
+            defense_idx = column_indices.get(defense_col)
+        
+        scoring_columns = self._match_scoring_columns()
+        
+        # Classify the boolean stats columns once with set lookups; every team shares the keys
+        skipped_columns = set(individual_numeric_columns)
+        skipped_columns.update(('Team Number', 'Match Number'))
+        mode_columns = frozenset(self._mode_boolean_columns)
+        boolean_columns = [
+            (column_indices[col_name],
+             self._generate_stat_key(col_name, 'rate'),
+             self._generate_stat_key(col_name, 'mode') if col_name in mode_columns else None)
+            for col_name in self._selected_stats_columns
+            if col_name not in skipped_columns and col_name in column_indices
+        ]
+        
         for team_number, rows in team_data_grouped.items():
             team_stats: Dict[str, Any] = {'team': team_number}
             
+            # Parse every coral/algae column in a single pass over the team's rows
+            column_values: Dict[int, List[float]] = {col_idx: [] for col_idx in numeric_indices}
+            for row in rows:
+                row_len = len(row)
+                for col_idx, values in column_values.items():
+                    if col_idx < row_len:
+                        value = _parse_float(row[col_idx])
+                        if value is not None:
+                            values.append(value)
+            
             # Process coral and algae groups
-            for group_name, columns in coral_algae_groups.items():
-                group_values = []
-                for col_name in columns:
-                    col_idx = self._column_indices.get(col_name)
-                    if col_idx is None:
-                        continue
-                    for row in rows:
-                        if col_idx < len(row):
-                            try:
-                                group_values.append(float(row[col_idx]))
-                            except Exception:
-                                pass
-                avg_key = self._generate_stat_key(group_name, 'avg')
-                std_key = self._generate_stat_key(group_name, 'std')
+            for avg_key, std_key, indices in group_indices:
+                group_values = [value for col_idx in indices for value in column_values[col_idx]]
                 team_stats[avg_key] = self._average(group_values) if group_values else 0.0
                 team_stats[std_key] = self._standard_deviation(group_values) if group_values else 0.0
             
             # Individual numeric columns
-            individual_numeric_columns = []
-            for columns in coral_algae_groups.values():
-                individual_numeric_columns.extend(columns)
-            individual_numeric_columns = list(set(individual_numeric_columns))
-            
-            for col_name in individual_numeric_columns:
-                col_idx = self._column_indices.get(col_name)
-                if col_idx is None:
-                    continue
-                values = []
-                for row in rows:
-                    if col_idx < len(row):
-                        try:
-                            values.append(float(row[col_idx]))
-                        except Exception:
-                            pass
-                avg_key = self._generate_stat_key(col_name, 'avg')
-                std_key = self._generate_stat_key(col_name, 'std')
+            for avg_key, std_key, col_idx in individual_indices:
+                values = column_values[col_idx]
                 team_stats[avg_key] = self._average(values) if values else 0.0
                 team_stats[std_key] = self._standard_deviation(values) if values else 0.0
             
             # Defense rate
-            defense_col = 'Crossed Field/Defense'
-            defense_idx = self._column_indices.get(defense_col)
-            if defense_idx is None:
-                defense_col = 'Crossed Feild/Played Defense?'
-                defense_idx = self._column_indices.get(defense_col)
-            
             defense_values = []
             if defense_idx is not None:
                 for row in rows:
                     if defense_idx < len(row):
                         v = row[defense_idx].strip().lower()
-                        if v in ['true', 'yes', 'y', '1']:
+                        if v in _BASIC_TRUE_LIKE:
                             defense_values.append(1.0)
-                        elif v in ['false', 'no', 'n', '0']:
+                        elif v in _BASIC_FALSE_LIKE:
                             defense_values.append(0.0)
                 defense_key = self._generate_stat_key(defense_col, 'rate')
                 team_stats[defense_key] = self._average(defense_values) if defense_values else 0.0
             
             # Enhanced overall calculation
             overall_values = []
-            coral_values = []
-            algae_values = []
             
             for row in rows:
-                match_score = 0.0
-                
-                # Coral scoring with level-based weights
-                coral_weights = {'L1': 2, 'L2': 3, 'L3': 4, 'L4': 5}
-                for level, weight in coral_weights.items():
-                    # Auto coral
-                    auto_col = f'Coral {level} (Auto)'
-                    auto_idx = self._column_indices.get(auto_col)
-                    if auto_idx is not None and auto_idx < len(row):
-                        try:
-                            auto_val = float(row[auto_idx])
-                            match_score += auto_val * weight * 2
-                            coral_values.append(auto_val * weight * 2)
-                        except Exception:
-                            pass
-                    
-                    # Teleop coral
-                    teleop_col = f'Coral {level} (Teleop)'
-                    teleop_idx = self._column_indices.get(teleop_col)
-                    if teleop_idx is not None and teleop_idx < len(row):
-                        try:
-                            teleop_val = float(row[teleop_idx])
-                            match_score += teleop_val * weight
-                            coral_values.append(teleop_val * weight)
-                        except Exception:
-                            pass
-                    
-                    # Legacy format fallback
-                    legacy_col = f'Coral {level} Scored'
-                    legacy_idx = self._column_indices.get(legacy_col)
-                    if legacy_idx is not None and legacy_idx < len(row) and auto_idx is None and teleop_idx is None:
-                        try:
-                            legacy_val = float(row[legacy_idx])
-                            match_score += legacy_val * weight * 1.5
-                            coral_values.append(legacy_val * weight * 1.5)
-                        except Exception:
-                            pass
-                
-                # Algae scoring
-                algae_configs = [
-                    ('Barge Algae (Auto)', 3 * 1.5),
-                    ('Barge Algae (Teleop)', 3),
-                    ('Processor Algae (Auto)', 6 * 1.5),
-                    ('Processor Algae (Teleop)', 6),
-                    ('Algae Scored in Barge', 3)
-                ]
-                
-                for col_name, points in algae_configs:
-                    col_idx = self._column_indices.get(col_name)
-                    if col_idx is not None and col_idx < len(row):
-                        try:
-                            val = float(row[col_idx])
-                            match_score += val * points
-                            algae_values.append(val * points)
-                        except Exception:
-                            pass
-                
-                # Endgame scoring
-                end_pos_idx = self._column_indices.get('End Position')
-                climb_idx = self._column_indices.get('Climbed?')
-                
-                if end_pos_idx is not None and end_pos_idx < len(row):
-                    end_pos = str(row[end_pos_idx]).strip().lower()
-                    if 'deep' in end_pos:
-                        match_score += 12
-                    elif 'shallow' in end_pos:
-                        match_score += 6
-                    elif 'park' in end_pos:
-                        match_score += 2
-                elif climb_idx is not None and climb_idx < len(row):
-                    try:
-                        climb_val = float(row[climb_idx])
-                        if climb_val > 0:
-                            match_score += 8
-                    except Exception:
-                        pass
+                match_score = self._score_match_row(row, *scoring_columns)
                 
                 if match_score > 0:
                     overall_values.append(match_score)
@@ -843,17 +818,10 @@ class AnalizadorRobot:
             team_stats['overall_std'] = self._standard_deviation(overall_values) if overall_values else 0.0
             
             # Boolean columns: rate and mode
-            for col_name in self._selected_stats_columns:
-                if col_name in individual_numeric_columns or col_name in ['Team Number', 'Match Number']:
-                    continue
-                col_idx = self._column_indices.get(col_name)
-                if col_idx is None:
-                    continue
+            for col_idx, rate_key, mode_key in boolean_columns:
                 str_vals = [row[col_idx] for row in rows if col_idx < len(row)]
-                rate_key = self._generate_stat_key(col_name, 'rate')
                 team_stats[rate_key] = self._rate_from_strs(str_vals)
-                if col_name in self._mode_boolean_columns:
-                    mode_key = self._generate_stat_key(col_name, 'mode')
+                if mode_key is not None:
                     team_stats[mode_key] = self._calculate_mode(str_vals)
             
             # Robot valuation
@@ -974,6 +942,64 @@ class AnalizadorRobot:
         """Get current robot valuation phase weights."""
         return list(self.robot_valuation_phase_weights)
 
+    def _match_scoring_columns(self) -> tuple:
+        """
+        Resolve the columns used to score a single match row.
+
+        Coral levels and algae are flattened into one list of (column index, points)
+        pairs so a row is scored in a single pass; endgame indices are returned separately.
+        """
+        weighted_columns = []
+        coral_weights = {'L1': 2, 'L2': 3, 'L3': 4, 'L4': 5}
+        for level, weight in coral_weights.items():
+            auto_idx = self._column_indices.get(f'Coral {level} (Auto)')
+            teleop_idx = self._column_indices.get(f'Coral {level} (Teleop)')
+            legacy_idx = self._column_indices.get(f'Coral {level} Scored')
+            if auto_idx is not None:
+                weighted_columns.append((auto_idx, weight * 2))
+            if teleop_idx is not None:
+                weighted_columns.append((teleop_idx, weight))
+            # Legacy format fallback
+            if legacy_idx is not None and auto_idx is None and teleop_idx is None:
+                weighted_columns.append((legacy_idx, weight * 1.5))
+        
+        algae_configs = [
+            ('Barge Algae (Auto)', 3 * 1.5),
+            ('Barge Algae (Teleop)', 3),
+            ('Processor Algae (Auto)', 6 * 1.5),
+            ('Processor Algae (Teleop)', 6),
+            ('Algae Scored in Barge', 3)
+        ]
+        for col_name, points in algae_configs:
+            col_idx = self._column_indices.get(col_name)
+            if col_idx is not None:
+                weighted_columns.append((col_idx, points))
+        
+        return (weighted_columns,
+                self._column_indices.get('End Position'),
+                self._column_indices.get('Climbed?'))
+
+    def _score_match_row(self, row: List[str], weighted_columns: List[tuple],
+                         end_pos_idx: Optional[int], climb_idx: Optional[int]) -> float:
+        """Score one match row for coral, algae and endgame using resolved columns."""
+        match_score = 0.0
+        row_len = len(row)
+        for col_idx, points in weighted_columns:
+            if col_idx < row_len:
+                val = _parse_float(row[col_idx])
+                if val is not None:
+                    match_score += val * points
+        
+        # Endgame scoring
+        if end_pos_idx is not None and end_pos_idx < row_len:
+            match_score += _end_position_points(str(row[end_pos_idx]))
+        elif climb_idx is not None and climb_idx < row_len:
+            climb_val = _parse_float(row[climb_idx])
+            if climb_val is not None and climb_val > 0:
+                match_score += 8
+        
+        return match_score
+
     def _split_rows_into_phases(self, rows: List[List[str]]) -> List[List[List[str]]]:
         """Split rows into 3 phases (Q1, Q2, Q3) as evenly as possible."""
         n = len(rows)
@@ -995,6 +1021,14 @@ class AnalizadorRobot:
         phase_weights = self.robot_valuation_phase_weights
         phase_scores = []
         
+        scoring_columns = self._match_scoring_columns()
+        defense_idx = self._column_indices.get('Crossed Field/Defense')
+        if defense_idx is None:
+            defense_idx = self._column_indices.get('Crossed Feild/Played Defense?')
+        auto_moved_idx = self._column_indices.get('Moved (Auto)')
+        if auto_moved_idx is None:
+            auto_moved_idx = self._column_indices.get('Did something?')
+        
         for phase_rows in phases:
             phase_total = 0.0
             match_count = len(phase_rows)
@@ -1004,97 +1038,18 @@ class AnalizadorRobot:
                 continue
             
             for row in phase_rows:
-                match_score = 0.0
-                
-                # Coral scoring with level-based weights
-                coral_weights = {'L1': 2, 'L2': 3, 'L3': 4, 'L4': 5}
-                for level, weight in coral_weights.items():
-                    # Auto coral
-                    auto_col = f'Coral {level} (Auto)'
-                    auto_idx = self._column_indices.get(auto_col)
-                    if auto_idx is not None and auto_idx < len(row):
-                        try:
-                            auto_val = float(row[auto_idx])
-                            match_score += auto_val * weight * 2.0
-                        except Exception:
-                            pass
-                    
-                    # Teleop coral
-                    teleop_col = f'Coral {level} (Teleop)'
-                    teleop_idx = self._column_indices.get(teleop_col)
-                    if teleop_idx is not None and teleop_idx < len(row):
-                        try:
-                            teleop_val = float(row[teleop_idx])
-                            match_score += teleop_val * weight
-                        except Exception:
-                            pass
-                    
-                    # Legacy format fallback
-                    legacy_col = f'Coral {level} Scored'
-                    legacy_idx = self._column_indices.get(legacy_col)
-                    if legacy_idx is not None and legacy_idx < len(row) and auto_idx is None and teleop_idx is None:
-                        try:
-                            legacy_val = float(row[legacy_idx])
-                            match_score += legacy_val * weight * 1.5
-                        except Exception:
-                            pass
-                
-                # Algae scoring
-                algae_configs = [
-                    ('Barge Algae (Auto)', 4.5),
-                    ('Barge Algae (Teleop)', 3),
-                    ('Processor Algae (Auto)', 9),
-                    ('Processor Algae (Teleop)', 6),
-                    ('Algae Scored in Barge', 3)
-                ]
-                
-                for col_name, points in algae_configs:
-                    col_idx = self._column_indices.get(col_name)
-                    if col_idx is not None and col_idx < len(row):
-                        try:
-                            val = float(row[col_idx])
-                            match_score += val * points
-                        except Exception:
-                            pass
-                
-                # Endgame scoring
-                end_pos_idx = self._column_indices.get('End Position')
-                climb_idx = self._column_indices.get('Climbed?')
-                
-                if end_pos_idx is not None and end_pos_idx < len(row):
-                    end_pos = str(row[end_pos_idx]).strip().lower()
-                    if 'deep' in end_pos:
-                        match_score += 12
-                    elif 'shallow' in end_pos:
-                        match_score += 6
-                    elif 'park' in end_pos:
-                        match_score += 2
-                elif climb_idx is not None and climb_idx < len(row):
-                    try:
-                        climb_val = float(row[climb_idx])
-                        if climb_val > 0:
-                            match_score += 8
-                    except Exception:
-                        pass
+                match_score = self._score_match_row(row, *scoring_columns)
                 
                 # Defense/activity bonus
-                defense_idx = self._column_indices.get('Crossed Field/Defense')
-                if defense_idx is None:
-                    defense_idx = self._column_indices.get('Crossed Feild/Played Defense?')
-                
                 if defense_idx is not None and defense_idx < len(row):
                     defense_val = str(row[defense_idx]).strip().lower()
-                    if defense_val in ['true', 'yes', 'y', '1']:
+                    if defense_val in _BASIC_TRUE_LIKE:
                         match_score += 5
                 
                 # Auto movement bonus
-                auto_moved_idx = self._column_indices.get('Moved (Auto)')
-                if auto_moved_idx is None:
-                    auto_moved_idx = self._column_indices.get('Did something?')
-                
                 if auto_moved_idx is not None and auto_moved_idx < len(row):
                     moved_val = str(row[auto_moved_idx]).strip().lower()
-                    if moved_val in ['true', 'yes', 'y', '1']:
+                    if moved_val in _BASIC_TRUE_LIKE:
                         match_score += 3
                 
                 phase_total += match_score
@@ -1133,10 +1088,9 @@ class AnalizadorRobot:
             for col_name in self._selected_numeric_columns_for_overall:
                 idx = self._column_indices.get(col_name)
                 if idx is not None and idx < len(row):
-                    try:
-                        vals.append(float(row[idx]))
-                    except Exception:
-                        pass
+                    value = _parse_float(row[idx])
+                    if value is not None:
+                        vals.append(value)
             overall = sum(vals) / len(vals) if vals else 0.0
             if team_numbers is not None and team not in team_numbers:
                 continue
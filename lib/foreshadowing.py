@@ -19,15 +19,31 @@ Características:
 Marco Lopez - Overture 7421
 """
 
+import bisect
 import math
-import random
+import sys
+from itertools import accumulate
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 
+import numpy as np
+
+# dataclass(slots=True) requiere Python 3.10; en versiones anteriores se usan dicts normales
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 # ============================= CONFIGURACIÓN DE JUEGO ============================= #
 
+CORAL_LEVELS = ('L1', 'L2', 'L3', 'L4')
+CLIMB_KEYS = ('none', 'park', 'shallow', 'deep')
+
+# Distribuciones de climb por nivel de equipo, en el orden de CLIMB_KEYS
+_CLIMB_PROBS_DEFAULT = (0.4, 0.3, 0.2, 0.1)
+_CLIMB_PROBS_STRONG = (0.1, 0.2, 0.4, 0.3)
+_CLIMB_PROBS_MEDIUM = (0.2, 0.3, 0.4, 0.1)
+_CLIMB_PROBS_WEAK = (0.5, 0.3, 0.15, 0.05)
+
 def _load_game_config_from_json() -> Optional[Dict]:
     """Load game configuration from JSON file."""
     config_paths = [
@@ -80,6 +96,17 @@ class GameConfig:
     
     cooperation_threshold: int = 2  # Algae mínimas en cada processor para coop
     
+    # Puntos por categoría en el orden del simulador (coral auto L1-L4, coral teleop L1-L4,
+    # processor auto, processor teleop, net); se deriva de los campos anteriores
+    score_weights: np.ndarray = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.score_weights = np.array(
+            [self.coral_auto_points[level] for level in CORAL_LEVELS] +
+            [self.coral_teleop_points[level] for level in CORAL_LEVELS] +
+            [self.processor_points, self.processor_points, self.net_points]
+        )
+    
     @classmethod
     def from_json(cls, config_dict: Optional[Dict] = None) -> 'GameConfig':
         """Create GameConfig from JSON dictionary or load from file."""
@@ -115,9 +142,13 @@ class GameConfig:
         )
 
 
+# Puntos de climb por defecto, usados cuando no se especifica una configuración
+DEFAULT_CLIMB_POINTS = GameConfig().climb_points
+
+
 # ============================= MODELOS DE DATOS ============================= #
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TeamPerformance:
     """Rendimiento estadístico de un equipo"""
     team_number: str
@@ -142,23 +173,24 @@ class TeamPerformance:
     p_cooperation: float = 0.3
     
     # Distribución de climb
-    climb_distribution: Dict[str, float] = field(default_factory=lambda: {
-        "none": 0.4, "park": 0.3, "shallow": 0.2, "deep": 0.1
-    })
+    climb_distribution: Dict[str, float] = field(
+        default_factory=lambda: dict(zip(CLIMB_KEYS, _CLIMB_PROBS_DEFAULT))
+    )
     
     def total_coral_per_match(self) -> float:
         """Total de corales promedio por match"""
         return (self.auto_L1 + self.auto_L2 + self.auto_L3 + self.auto_L4 + 
                 self.teleop_L1 + self.teleop_L2 + self.teleop_L3 + self.teleop_L4)
     
-    def expected_climb_points(self) -> float:
+    def expected_climb_points(self, climb_points: Optional[Dict[str, int]] = None) -> float:
         """Puntos esperados de climb"""
-        config = GameConfig()
-        return sum(prob * config.climb_points[climb_type] 
+        if climb_points is None:
+            climb_points = DEFAULT_CLIMB_POINTS
+        return sum(prob * climb_points[climb_type] 
                   for climb_type, prob in self.climb_distribution.items())
 
 
-@dataclass 
+@dataclass(**_DATACLASS_SLOTS)
 class MatchPrediction:
     """Predicción completa de un match"""
     red_teams: List[TeamPerformance]
@@ -187,10 +219,42 @@ class TeamStatsExtractor:
     
     def __init__(self, analizador, config: Optional[GameConfig] = None):
         self.analizador = analizador
-        self.config = config if config else GameConfig.from_json()
+        self._config = config
+        self._team_stats_index: Optional[Dict[str, Dict]] = None
+        self._performance_cache: Dict[str, TeamPerformance] = {}
+        # Versión de datos del analizador con la que se llenaron los caches
+        self._data_version = getattr(analizador, 'data_version', None)
+    
+    @property
+    def config(self) -> GameConfig:
+        """Configuración del juego, cargada al primer uso"""
+        if self._config is None:
+            self._config = GameConfig.from_json()
+        return self._config
+    
+    def invalidate_cache(self):
+        """Descarta el índice de estadísticas para recalcularlo en la siguiente consulta"""
+        self._team_stats_index = None
+        self._performance_cache.clear()
+    
+    def _sync_data_version(self):
+        """Invalida los caches si el analizador cargó datos nuevos desde la última consulta"""
+        data_version = getattr(self.analizador, 'data_version', None)
+        if data_version != self._data_version:
+            self._data_version = data_version
+            self.invalidate_cache()
     
     def extract_team_performance(self, team_number: str) -> TeamPerformance:
-        """Extrae el rendimiento estadístico de un equipo"""
+        """Extrae el rendimiento estadístico de un equipo (memoizado por número de equipo)"""
+        self._sync_data_version()
+        cached = self._performance_cache.get(team_number)
+        if cached is None:
+            cached = self._compute_team_performance(team_number)
+            self._performance_cache[team_number] = cached
+        return cached
+    
+    def _compute_team_performance(self, team_number: str) -> TeamPerformance:
+        """Calcula el rendimiento estadístico de un equipo a partir de sus estadísticas"""
         team_stats = self._get_team_detailed_stats(team_number)
         
         if not team_stats:
@@ -249,14 +313,28 @@ class TeamStatsExtractor:
         
         return perf
     
+    def _build_team_stats_index(self) -> Dict[str, Dict]:
+        """Calcula las estadísticas de todos los equipos una sola vez y las indexa por número"""
+        index: Dict[str, Dict] = {}
+        for team_stat in self.analizador.get_detailed_team_stats():
+            index.setdefault(str(team_stat.get('team', '')), team_stat)
+        return index
+    
+    def _ensure_team_stats_index(self) -> Dict[str, Dict]:
+        """Devuelve el índice de estadísticas, construyéndolo si hace falta"""
+        if self._team_stats_index is None:
+            self._team_stats_index = self._build_team_stats_index()
+        return self._team_stats_index
+    
+    def get_team_numbers(self) -> List[str]:
+        """Equipos con estadísticas, en el orden del analizador, sin recalcularlas"""
+        self._sync_data_version()
+        return [team for team in self._ensure_team_stats_index() if team]
+    
     def _get_team_detailed_stats(self, team_number: str) -> Optional[Dict]:
         """Obtiene estadísticas detalladas del equipo"""
         try:
-            all_stats = self.analizador.get_detailed_team_stats()
-            for team_stat in all_stats:
-                if str(team_stat.get('team', '')) == str(team_number):
-                    return team_stat
-            return None
+            return self._ensure_team_stats_index().get(str(team_number))
         except Exception as e:
             print(f"Error obteniendo estadísticas para equipo {team_number}: {e}")
             return None
@@ -267,11 +345,12 @@ class TeamStatsExtractor:
         overall_avg = team_stats.get('overall_avg', 0.0)
         
         if overall_avg > 50:  # Equipo fuerte
-            return {"none": 0.1, "park": 0.2, "shallow": 0.4, "deep": 0.3}
+            probs = _CLIMB_PROBS_STRONG
         elif overall_avg > 30:  # Equipo medio
-            return {"none": 0.2, "park": 0.3, "shallow": 0.4, "deep": 0.1}
+            probs = _CLIMB_PROBS_MEDIUM
         else:  # Equipo débil
-            return {"none": 0.5, "park": 0.3, "shallow": 0.15, "deep": 0.05}
+            probs = _CLIMB_PROBS_WEAK
+        return dict(zip(CLIMB_KEYS, probs))
 
 
 # ============================= SIMULADOR DE MATCHES ============================= #
@@ -279,48 +358,79 @@ class TeamStatsExtractor:
 class MatchSimulator:
     """Simula matches usando distribuciones estadísticas"""
     
-    def __init__(self, config: Optional[GameConfig] = None):
+    def __init__(self, config: Optional[GameConfig] = None, seed: Optional[int] = None):
         self.config = config if config else GameConfig.from_json()
+        # Generador propio (PCG64) para todos los sorteos; una semilla hace las simulaciones reproducibles
+        self._rng = np.random.default_rng(seed)
+        
+        # Vector único (11) para puntuar coral y algae con un solo producto
+        self._score_weights = self.config.score_weights
+        self._coop_min_processor = self.config.cooperation_threshold * 2  # 2 processors
     
     def simulate_match(self, red_teams: List[TeamPerformance], 
                       blue_teams: List[TeamPerformance], 
                       num_simulations: int = 1000) -> MatchPrediction:
         """Simula un match completo usando Monte Carlo"""
         
-        red_scores = []
-        blue_scores = []
-        red_rps = []
-        blue_rps = []
+        if num_simulations <= 0:
+            raise ValueError(f"num_simulations debe ser positivo, se recibió {num_simulations}")
         
-        for _ in range(num_simulations):
-            # Simular una instancia del match
-            red_result = self._simulate_alliance(red_teams)
-            blue_result = self._simulate_alliance(blue_teams)
-            
-            red_scores.append(red_result['total_score'])
-            blue_scores.append(blue_result['total_score'])
-            
-            # Calcular RPs para esta simulación
-            red_rp, blue_rp = self._calculate_ranking_points(
-                red_result, blue_result, red_teams, blue_teams
+        # Sin equipos no hay nada que sortear: predicción en cero
+        if not red_teams and not blue_teams:
+            return MatchPrediction(
+                red_teams=red_teams,
+                blue_teams=blue_teams,
+                red_breakdown=self._simulate_alliance([]),
+                blue_breakdown=self._simulate_alliance([])
             )
-            red_rps.append(red_rp)
-            blue_rps.append(blue_rp)
+        
+        # Las medias de cada equipo no cambian entre simulaciones; se apilan los equipos
+        # de ambas alianzas en una sola matriz y cada alianza es un rango de filas
+        teams = red_teams + blue_teams
+        n_red = len(red_teams)
+        team_rates = self._alliance_rates(teams)
+        climbs = self._climb_tables(teams)
+        red_rates, blue_rates = team_rates[:n_red], team_rates[n_red:]
+        
+        # Todas las simulaciones a la vez. La suma de Poissons independientes es Poisson con
+        # la suma de las medias, así que se sortean directamente los totales de cada alianza;
+        # un solo sorteo (simulaciones x 2 x 11) cubre ambas alianzas
+        alliance_rates = np.stack([red_rates.sum(axis=0), blue_rates.sum(axis=0)])
+        totals = self._rng.poisson(alliance_rates, size=(num_simulations,) + alliance_rates.shape)
+        red_totals = totals[:, 0]
+        blue_totals = totals[:, 1]
+        
+        # Climb y zona autónoma de los equipos de ambas alianzas en un solo lote
+        climb_points, left_zone = self._simulate_endgame_batch(teams, climbs, num_simulations)
+        red_climb_points = climb_points[:, :n_red].sum(axis=1)
+        blue_climb_points = climb_points[:, n_red:].sum(axis=1)
+        red_left = left_zone[:, :n_red].sum(axis=1)
+        blue_left = left_zone[:, n_red:].sum(axis=1)
+        
+        # Coral y algae de ambas alianzas en un solo producto
+        coral_algae_scores = totals @ self._score_weights
+        red_scores = coral_algae_scores[:, 0] + red_climb_points
+        blue_scores = coral_algae_scores[:, 1] + blue_climb_points
+        
+        # Calcular RPs de todas las simulaciones
+        red_rps, blue_rps = self._calculate_ranking_points(
+            red_scores, blue_scores, red_totals, blue_totals, red_left, blue_left
+        )
         
         # Calcular promedios y probabilidades
-        avg_red_score = sum(red_scores) / num_simulations
-        avg_blue_score = sum(blue_scores) / num_simulations
-        avg_red_rp = sum(red_rps) / num_simulations
-        avg_blue_rp = sum(blue_rps) / num_simulations
+        avg_red_score = float(red_scores.mean())
+        avg_blue_score = float(blue_scores.mean())
+        avg_red_rp = float(red_rps.mean())
+        avg_blue_rp = float(blue_rps.mean())
         
         # Probabilidades de victoria
-        red_wins = sum(1 for r, b in zip(red_scores, blue_scores) if r > b)
-        blue_wins = sum(1 for r, b in zip(red_scores, blue_scores) if b > r)
+        red_wins = int(np.count_nonzero(red_scores > blue_scores))
+        blue_wins = int(np.count_nonzero(blue_scores > red_scores))
         ties = num_simulations - red_wins - blue_wins
         
         # Breakdown detallado (usando última simulación como ejemplo)
-        red_breakdown = self._simulate_alliance(red_teams)
-        blue_breakdown = self._simulate_alliance(blue_teams)
+        red_breakdown = self._simulate_alliance(red_teams, red_rates, climbs[:n_red])
+        blue_breakdown = self._simulate_alliance(blue_teams, blue_rates, climbs[n_red:])
         
         return MatchPrediction(
             red_teams=red_teams,
@@ -336,14 +446,83 @@ class MatchSimulator:
             tie_probability=ties / num_simulations
         )
     
-    def _simulate_alliance(self, teams: List[TeamPerformance]) -> Dict:
+    @staticmethod
+    def _alliance_rates(teams: List[TeamPerformance]) -> np.ndarray:
+        """Matriz (equipos x 11) de medias Poisson en el orden que consume el simulador"""
+        rates = np.array([
+            [team.auto_L1, team.auto_L2, team.auto_L3, team.auto_L4,
+             team.teleop_L1, team.teleop_L2, team.teleop_L3, team.teleop_L4,
+             team.auto_processor, team.teleop_processor, team.teleop_net]
+            for team in teams
+        ], dtype=np.float64).reshape(len(teams), 11)
+        return np.maximum(rates, 0.0)
+    
+    @staticmethod
+    def _climb_tables(teams: List[TeamPerformance]) -> List[Tuple[Tuple[str, ...], Tuple[float, ...]]]:
+        """Tipos de climb y probabilidades acumuladas de cada equipo"""
+        tables = []
+        for team in teams:
+            climb_types = tuple(team.climb_distribution)
+            cumulative = tuple(accumulate(team.climb_distribution.values()))
+            tables.append((climb_types, cumulative))
+        return tables
+    
+    def _simulate_endgame_batch(self, teams: List[TeamPerformance],
+                                climb_tables: List[Tuple[Tuple[str, ...], Tuple[float, ...]]],
+                                num_simulations: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simula climb y zona autónoma de varios equipos en todas las simulaciones a la vez.
+        
+        Devuelve matrices (simulaciones x equipos) con los puntos de climb de cada equipo
+        y si salió de la zona autónoma.
+        """
+        climb_point_values = self.config.climb_points
+        none_points = climb_point_values["none"]
+        width = max((len(climb_types) for climb_types, _ in climb_tables), default=0)
+        
+        # Tablas apiladas (equipos x width); los huecos nunca se alcanzan (inf) y
+        # la columna extra de puntos es el fallback "none"
+        cumulative = np.full((len(climb_tables), width), np.inf)
+        points_dtype = np.asarray(list(climb_point_values.values())).dtype
+        points_lookup = np.full((len(climb_tables), width + 1), none_points, dtype=points_dtype)
+        for row, (climb_types, team_cumulative) in enumerate(climb_tables):
+            cumulative[row, :len(team_cumulative)] = team_cumulative
+            points_lookup[row, :len(climb_types)] = [climb_point_values[climb_type]
+                                                     for climb_type in climb_types]
+        
+        # Igual que bisect_left: cuántos umbrales quedan estrictamente por debajo del sorteo
+        draws = self._rng.random((num_simulations, len(climb_tables)))
+        index = (draws[:, :, None] > cumulative[None, :, :]).sum(axis=2)
+        climb_points = points_lookup[np.arange(len(climb_tables)), index]
+        
+        p_leave = np.array([team.p_leave_auto_zone for team in teams], dtype=np.float64)
+        left_zone = self._rng.random((num_simulations, len(teams))) < p_leave
+        
+        return climb_points, left_zone
+    
+    def _simulate_alliance(self, teams: List[TeamPerformance],
+                           rates: Optional[np.ndarray] = None,
+                           climb_tables: Optional[List[Tuple[Tuple[str, ...], Tuple[float, ...]]]] = None) -> Dict:
         """Simula el rendimiento de una alianza"""
+        if rates is None:
+            rates = self._alliance_rates(teams)
+        if climb_tables is None:
+            climb_tables = self._climb_tables(teams)
+        # Un solo sorteo Poisson para todos los equipos y categorías
+        counts = self._rng.poisson(rates)
+        totals = counts.sum(axis=0)
+        
+        # Coral por nivel como vectores (L1..L4); sólo se pasan a dict para el breakdown
+        auto_coral = totals[:4]
+        teleop_coral = totals[4:8]
+        auto_processor, teleop_processor, net_algae = totals[8:].tolist()
+        
         result = {
-            'coral_scores': {'L1': 0, 'L2': 0, 'L3': 0, 'L4': 0},
-            'auto_coral': {'L1': 0, 'L2': 0, 'L3': 0, 'L4': 0},
-            'teleop_coral': {'L1': 0, 'L2': 0, 'L3': 0, 'L4': 0},
-            'processor_algae': {'auto': 0, 'teleop': 0},
-            'net_algae': 0,
+            'coral_scores': dict(zip(CORAL_LEVELS, (auto_coral + teleop_coral).tolist())),
+            'auto_coral': dict(zip(CORAL_LEVELS, auto_coral.tolist())),
+            'teleop_coral': dict(zip(CORAL_LEVELS, teleop_coral.tolist())),
+            'processor_algae': {'auto': auto_processor, 'teleop': teleop_processor},
+            'net_algae': net_algae,
             'climb_scores': [],
             'coral_points': 0,
             'algae_points': 0,
@@ -353,152 +532,93 @@ class MatchSimulator:
             'cooperation_achieved': False
         }
         
-        # Simular cada equipo
-        for team in teams:
-            # Coral Auto (distribución Poisson)
-            auto_coral = {
-                'L1': self._poisson_sample(team.auto_L1),
-                'L2': self._poisson_sample(team.auto_L2),
-                'L3': self._poisson_sample(team.auto_L3),
-                'L4': self._poisson_sample(team.auto_L4)
-            }
-            
-            # Coral Teleop
-            teleop_coral = {
-                'L1': self._poisson_sample(team.teleop_L1),
-                'L2': self._poisson_sample(team.teleop_L2),
-                'L3': self._poisson_sample(team.teleop_L3),
-                'L4': self._poisson_sample(team.teleop_L4)
-            }
-            
-            # Acumular coral
-            for level in ['L1', 'L2', 'L3', 'L4']:
-                result['auto_coral'][level] += auto_coral[level]
-                result['teleop_coral'][level] += teleop_coral[level]
-                result['coral_scores'][level] += auto_coral[level] + teleop_coral[level]
-            
-            # Algae
-            result['processor_algae']['auto'] += self._poisson_sample(team.auto_processor)
-            result['processor_algae']['teleop'] += self._poisson_sample(team.teleop_processor)
-            result['net_algae'] += self._poisson_sample(team.teleop_net)
-            
+        # Climb y zona autónoma se muestrean por equipo
+        climb_point_values = self.config.climb_points
+        for team, climb_table in zip(teams, climb_tables):
             # Climb
-            climb_type = self._sample_climb(team.climb_distribution)
-            climb_points = self.config.climb_points[climb_type]
+            climb_type = self._sample_climb(*climb_table)
+            climb_points = climb_point_values[climb_type]
             result['climb_scores'].append((team.team_number, climb_type, climb_points))
             result['climb_points'] += climb_points
             
             # Autonomous zone
-            if random.random() < team.p_leave_auto_zone:
+            if self._rng.random() < team.p_leave_auto_zone:
                 result['teams_left_auto_zone'] += 1
         
         # Calcular puntos
-        result['coral_points'] = self._calculate_coral_points(result)
-        result['algae_points'] = self._calculate_algae_points(result)
+        result['coral_points'] = self._calculate_coral_points(totals)
+        result['algae_points'] = self._calculate_algae_points(totals)
         
         # Cooperation
-        total_processor = result['processor_algae']['auto'] + result['processor_algae']['teleop']
-        result['cooperation_achieved'] = total_processor >= self.config.cooperation_threshold * 2  # 2 processors
+        total_processor = auto_processor + teleop_processor
+        result['cooperation_achieved'] = total_processor >= self._coop_min_processor
         
         result['total_score'] = result['coral_points'] + result['algae_points'] + result['climb_points']
         
         return result
     
-    def _calculate_coral_points(self, alliance_result: Dict) -> int:
-        """Calcula puntos de coral"""
-        points = 0
-        
-        # Auto coral
-        for level, count in alliance_result['auto_coral'].items():
-            points += count * self.config.coral_auto_points[level]
-        
-        # Teleop coral
-        for level, count in alliance_result['teleop_coral'].items():
-            points += count * self.config.coral_teleop_points[level]
-        
-        return points
+    def _calculate_coral_points(self, totals: np.ndarray) -> int:
+        """Calcula puntos de coral a partir de los totales de la alianza"""
+        return int(totals[:8] @ self._score_weights[:8])
     
-    def _calculate_algae_points(self, alliance_result: Dict) -> int:
-        """Calcula puntos de algae"""
-        points = 0
-        
-        # Processor algae
-        total_processor = alliance_result['processor_algae']['auto'] + alliance_result['processor_algae']['teleop']
-        points += total_processor * self.config.processor_points
-        
-        # Net algae
-        points += alliance_result['net_algae'] * self.config.net_points
-        
-        return points
+    def _calculate_algae_points(self, totals: np.ndarray) -> int:
+        """Calcula puntos de algae a partir de los totales de la alianza"""
+        # Processor (auto y teleop) y net
+        return int(totals[8:] @ self._score_weights[8:])
     
-    def _calculate_ranking_points(self, red_result: Dict, blue_result: Dict,
-                                red_teams: List[TeamPerformance], 
-                                blue_teams: List[TeamPerformance]) -> Tuple[int, int]:
-        """Calcula Ranking Points para ambas alianzas"""
-        red_rp = 0
-        blue_rp = 0
-        
+    def _calculate_ranking_points(self, red_scores: np.ndarray, blue_scores: np.ndarray,
+                                  red_totals: np.ndarray, blue_totals: np.ndarray,
+                                  red_left: np.ndarray, blue_left: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Calcula Ranking Points para ambas alianzas en cada simulación"""
         # Win/Tie/Loss RP
-        if red_result['total_score'] > blue_result['total_score']:
-            red_rp += 3  # Win
-            blue_rp += 0  # Loss
-        elif blue_result['total_score'] > red_result['total_score']:
-            blue_rp += 3  # Win
-            red_rp += 0  # Loss
-        else:
-            red_rp += 1  # Tie
-            blue_rp += 1  # Tie
-        
-        # Auto RP
-        if (red_result['teams_left_auto_zone'] >= 3 and 
-            sum(red_result['auto_coral'].values()) >= 1):
-            red_rp += 1
+        ties = red_scores == blue_scores
+        red_rp = np.where(red_scores > blue_scores, 3, np.where(ties, 1, 0))
+        blue_rp = np.where(blue_scores > red_scores, 3, np.where(ties, 1, 0))
         
-        if (blue_result['teams_left_auto_zone'] >= 3 and 
-            sum(blue_result['auto_coral'].values()) >= 1):
-            blue_rp += 1
+        # Auto RP: los 3 equipos salen de la zona y al menos un coral en auto
+        red_rp += (red_left >= 3) & (red_totals[:, :4].sum(axis=1) >= 1)
+        blue_rp += (blue_left >= 3) & (blue_totals[:, :4].sum(axis=1) >= 1)
         
         # Coral RP
-        if self._check_coral_rp(red_result):
-            red_rp += 1
-        
-        if self._check_coral_rp(blue_result):
-            blue_rp += 1
+        red_rp += self._check_coral_rp(red_totals)
+        blue_rp += self._check_coral_rp(blue_totals)
         
         return red_rp, blue_rp
     
-    def _check_coral_rp(self, alliance_result: Dict) -> bool:
-        """Verifica si se cumple el requisito de Coral RP"""
-        coral_counts = alliance_result['coral_scores']
-        cooperation = alliance_result['cooperation_achieved']
+    def _check_coral_rp(self, totals: np.ndarray) -> np.ndarray:
+        """Verifica por simulación si se cumple el requisito de Coral RP"""
+        coral_counts = totals[:, :4] + totals[:, 4:8]
         
-        if cooperation:
-            # Con cooperación: al menos 7 corales en 3 niveles
-            levels_with_7_plus = sum(1 for count in coral_counts.values() if count >= 7)
-            return levels_with_7_plus >= 3
-        else:
-            # Sin cooperación: al menos 7 corales en cada nivel
-            return all(count >= 7 for count in coral_counts.values())
-    
-    def _poisson_sample(self, mean: float) -> int:
-        """Muestra de distribución Poisson"""
-        if mean <= 0:
-            return 0
-        return max(0, int(random.gammavariate(mean, 1) + 0.5))
-    
-    def _sample_climb(self, distribution: Dict[str, float]) -> str:
-        """Muestra tipo de climb según distribución"""
-        rand = random.random()
-        cumulative = 0
+        # Un solo conteo de niveles con 7+ corales sirve para ambos casos
+        levels_with_7_plus = (coral_counts >= 7).sum(axis=1)
+        cooperation = totals[:, 8] + totals[:, 9] >= self._coop_min_processor
         
-        for climb_type, prob in distribution.items():
-            cumulative += prob
-            if rand <= cumulative:
-                return climb_type
+        # Con cooperación: al menos 7 corales en 3 niveles; sin ella, en cada nivel
+        return np.where(cooperation,
+                        levels_with_7_plus >= 3,
+                        levels_with_7_plus == len(CORAL_LEVELS))
+    
+    def _sample_climb(self, climb_types: Tuple[str, ...], cumulative: Tuple[float, ...]) -> str:
+        """Muestra tipo de climb según la distribución acumulada del equipo"""
+        # Primer umbral acumulado >= rand
+        index = bisect.bisect_left(cumulative, self._rng.random())
+        if index < len(climb_types):
+            return climb_types[index]
         
         return "none"  # Fallback
 
 
+# ============================= PREDICCIÓN HEADLESS ============================= #
+
+def predict_match(extractor: TeamStatsExtractor, simulator: MatchSimulator,
+                  red_team_numbers: List[str], blue_team_numbers: List[str],
+                  num_simulations: int = 1000) -> MatchPrediction:
+    """Predice un match a partir de los números de equipo, sin depender de ninguna interfaz"""
+    red_teams = [extractor.extract_team_performance(team) for team in red_team_numbers]
+    blue_teams = [extractor.extract_team_performance(team) for team in blue_team_numbers]
+    return simulator.simulate_match(red_teams, blue_teams, num_simulations=num_simulations)
+
+
 # ============================= INTERFAZ GRÁFICA (DEPRECATED) ============================= #
 # Note: The Tkinter GUI is deprecated in favor of the Streamlit UI.
 # This code is kept for backwards compatibility but should not be used for new development.
@@ -510,6 +630,20 @@ try:
 except ImportError:
     _TKINTER_AVAILABLE = False
 
+# Plantilla única para las filas de estadísticas individuales (equipo + 13 valores)
+_STATS_ROW_TEMPLATE = "\t".join(["{}"] + ["{:.2f}"] * 13)
+
+
+def _stats_row(team_number: str, perf: TeamPerformance) -> List[str]:
+    """Fila ya formateada de la tabla de estadísticas individuales"""
+    return _STATS_ROW_TEMPLATE.format(
+        team_number,
+        perf.auto_L1, perf.auto_L2, perf.auto_L3, perf.auto_L4,
+        perf.teleop_L1, perf.teleop_L2, perf.teleop_L3, perf.teleop_L4,
+        perf.auto_processor, perf.teleop_processor, perf.teleop_net,
+        perf.p_leave_auto_zone, perf.expected_climb_points()
+    ).split("\t")
+
 
 class ForeshadowingGUI:
     """Interfaz gráfica del sistema de Foreshadowing"""
@@ -517,13 +651,28 @@ class ForeshadowingGUI:
     def __init__(self, parent, analizador):
         self.parent = parent
         self.analizador = analizador
-        self.extractor = TeamStatsExtractor(analizador)
-        self.simulator = MatchSimulator()
+        # Se construyen en el primer uso para no leer la configuración al abrir la ventana
+        self._extractor: Optional[TeamStatsExtractor] = None
+        self._simulator: Optional[MatchSimulator] = None
         
         self.window = None
         self.red_team_vars = []
         self.blue_team_vars = []
         self.result_text = None
+    
+    @property
+    def extractor(self) -> TeamStatsExtractor:
+        """Extractor de estadísticas, creado al primer uso"""
+        if self._extractor is None:
+            self._extractor = TeamStatsExtractor(self.analizador)
+        return self._extractor
+    
+    @property
+    def simulator(self) -> MatchSimulator:
+        """Simulador de matches, creado al primer uso"""
+        if self._simulator is None:
+            self._simulator = MatchSimulator()
+        return self._simulator
         
     def show(self):
         """Muestra la ventana de Foreshadowing"""
@@ -569,29 +718,11 @@ class ForeshadowingGUI:
         # Obtener lista de equipos disponibles
         available_teams = self._get_available_teams()
         
-        # RED Alliance
-        red_frame = ttk.LabelFrame(teams_frame, text="RED Alliance", padding=5)
-        red_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
-        
-        self.red_team_vars = []
-        for i in range(3):
-            var = tk.StringVar()
-            ttk.Label(red_frame, text=f"Equipo {i+1}:").pack(anchor=tk.W)
-            combo = ttk.Combobox(red_frame, textvariable=var, values=available_teams, width=15)
-            combo.pack(fill=tk.X, pady=2)
-            self.red_team_vars.append(var)
-        
-        # BLUE Alliance  
-        blue_frame = ttk.LabelFrame(teams_frame, text="BLUE Alliance", padding=5)
-        blue_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5)
-        
-        self.blue_team_vars = []
-        for i in range(3):
-            var = tk.StringVar()
-            ttk.Label(blue_frame, text=f"Equipo {i+1}:").pack(anchor=tk.W)
-            combo = ttk.Combobox(blue_frame, textvariable=var, values=available_teams, width=15)
-            combo.pack(fill=tk.X, pady=2)
-            self.blue_team_vars.append(var)
+        # RED y BLUE Alliance
+        self.red_team_vars = self._create_alliance_selector(teams_frame, "RED Alliance",
+                                                            tk.LEFT, available_teams)
+        self.blue_team_vars = self._create_alliance_selector(teams_frame, "BLUE Alliance",
+                                                             tk.RIGHT, available_teams)
         
         # Botones de control
         control_frame = ttk.Frame(scrollable_frame)
@@ -619,32 +750,54 @@ class ForeshadowingGUI:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
     
+    @staticmethod
+    def _create_alliance_selector(parent, title: str, side: str, available_teams: List[str]) -> List:
+        """Crea los 3 selectores de equipo de una alianza y devuelve sus variables"""
+        frame = ttk.LabelFrame(parent, text=title, padding=5)
+        frame.pack(side=side, fill=tk.BOTH, expand=True, padx=5)
+        
+        team_vars = []
+        for i in range(3):
+            var = tk.StringVar()
+            ttk.Label(frame, text=f"Equipo {i+1}:").pack(anchor=tk.W)
+            ttk.Combobox(frame, textvariable=var, values=available_teams, width=15).pack(fill=tk.X, pady=2)
+            team_vars.append(var)
+        return team_vars
+    
+    @staticmethod
+    def _selected_teams(team_vars: List) -> List[str]:
+        """Equipos seleccionados, leyendo cada variable de Tk una sola vez"""
+        teams = []
+        for var in team_vars:
+            team = var.get().strip()
+            if team:
+                teams.append(team)
+        return teams
+    
     def _get_available_teams(self) -> List[str]:
         """Obtiene lista de equipos disponibles"""
         try:
-            stats = self.analizador.get_detailed_team_stats()
-            teams = [str(team_stat.get('team', '')) for team_stat in stats]
-            return sorted([t for t in teams if t])
+            self.extractor.invalidate_cache()
+            return sorted(self.extractor.get_team_numbers())
         except:
             return []
     
     def _predict_match(self):
         """Ejecuta predicción de match"""
         try:
+            self.extractor.invalidate_cache()
+            
             # Obtener equipos seleccionados
-            red_team_numbers = [var.get().strip() for var in self.red_team_vars if var.get().strip()]
-            blue_team_numbers = [var.get().strip() for var in self.blue_team_vars if var.get().strip()]
+            red_team_numbers = self._selected_teams(self.red_team_vars)
+            blue_team_numbers = self._selected_teams(self.blue_team_vars)
             
             if len(red_team_numbers) != 3 or len(blue_team_numbers) != 3:
                 messagebox.showerror("Error", "Debes seleccionar exactamente 3 equipos por alianza")
                 return
             
-            # Extraer estadísticas
-            red_teams = [self.extractor.extract_team_performance(team) for team in red_team_numbers]
-            blue_teams = [self.extractor.extract_team_performance(team) for team in blue_team_numbers]
-            
-            # Simular match
-            prediction = self.simulator.simulate_match(red_teams, blue_teams)
+            # Extraer estadísticas y simular match
+            prediction = predict_match(self.extractor, self.simulator,
+                                       red_team_numbers, blue_team_numbers)
             
             # Mostrar resultados
             self._display_prediction(prediction)
@@ -729,15 +882,19 @@ class ForeshadowingGUI:
     def _show_individual_stats(self):
         """Muestra estadísticas individuales de equipos"""
         # Obtener equipos seleccionados
-        all_teams = []
-        for var in self.red_team_vars + self.blue_team_vars:
-            if var.get().strip():
-                all_teams.append(var.get().strip())
+        all_teams = self._selected_teams(self.red_team_vars + self.blue_team_vars)
         
         if not all_teams:
             messagebox.showwarning("Advertencia", "Selecciona al menos un equipo")
             return
         
+        # Calcular todas las filas antes de tocar la interfaz
+        self.extractor.invalidate_cache()
+        rows = [
+            _stats_row(team_number, self.extractor.extract_team_performance(team_number))
+            for team_number in all_teams
+        ]
+        
         # Crear ventana de estadísticas
         stats_window = tk.Toplevel(self.window)
         stats_window.title("Estadísticas Individuales")
@@ -755,26 +912,7 @@ class ForeshadowingGUI:
             tree.column(col, width=70, anchor='center')
         
         # Llenar datos
-        for team_number in all_teams:
-            perf = self.extractor.extract_team_performance(team_number)
-            
-            row = [
-                team_number,
-                f"{perf.auto_L1:.2f}",
-                f"{perf.auto_L2:.2f}",
-                f"{perf.auto_L3:.2f}",
-                f"{perf.auto_L4:.2f}",
-                f"{perf.teleop_L1:.2f}",
-                f"{perf.teleop_L2:.2f}",
-                f"{perf.teleop_L3:.2f}",
-                f"{perf.teleop_L4:.2f}",
-                f"{perf.auto_processor:.2f}",
-                f"{perf.teleop_processor:.2f}",
-                f"{perf.teleop_net:.2f}",
-                f"{perf.p_leave_auto_zone:.2f}",
-                f"{perf.expected_climb_points():.2f}"
-            ]
-            
+        for row in rows:
             tree.insert('', 'end', values=row)
         
         tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -787,19 +925,20 @@ class ForeshadowingGUI:
     def _run_monte_carlo(self):
         """Ejecuta simulación Monte Carlo extendida"""
         try:
+            self.extractor.invalidate_cache()
+            
             # Obtener equipos
-            red_team_numbers = [var.get().strip() for var in self.red_team_vars if var.get().strip()]
-            blue_team_numbers = [var.get().strip() for var in self.blue_team_vars if var.get().strip()]
+            red_team_numbers = self._selected_teams(self.red_team_vars)
+            blue_team_numbers = self._selected_teams(self.blue_team_vars)
             
             if len(red_team_numbers) != 3 or len(blue_team_numbers) != 3:
                 messagebox.showerror("Error", "Debes seleccionar exactamente 3 equipos por alianza")
                 return
             
             # Ejecutar simulación con más iteraciones
-            red_teams = [self.extractor.extract_team_performance(team) for team in red_team_numbers]
-            blue_teams = [self.extractor.extract_team_performance(team) for team in blue_team_numbers]
-            
-            prediction = self.simulator.simulate_match(red_teams, blue_teams, num_simulations=5000)
+            prediction = predict_match(self.extractor, self.simulator,
+                                       red_team_numbers, blue_team_numbers,
+                                       num_simulations=5000)
             
             # Mostrar resultados extendidos
             self._display_monte_carlo_results(prediction)
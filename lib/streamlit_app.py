@@ -22,7 +22,7 @@ import threading
 import queue
 from tba_manager import TBAManager
 from default_robot_image import load_team_image
-from foreshadowing import TeamStatsExtractor, MatchSimulator
+from foreshadowing import TeamStatsExtractor, MatchSimulator, predict_match
 from exam_integrator import ExamDataIntegrator
 from qr_utils import scan_qr_codes, test_camera
 
@@ -149,6 +149,11 @@ if 'foreshadowing_team_performance' not in st.session_state:
     st.session_state.foreshadowing_team_performance = {"red": [], "blue": []}
 if 'foreshadowing_quick_slider' not in st.session_state:
     st.session_state.foreshadowing_quick_slider = 1000
+if 'foreshadowing_extractor' not in st.session_state:
+    st.session_state.foreshadowing_extractor = TeamStatsExtractor(st.session_state.analizador)
+if 'foreshadowing_simulator' not in st.session_state:
+    # Created on the first prediction, so a bad game config only fails that prediction
+    st.session_state.foreshadowing_simulator = None
 if 'exam_integrator' not in st.session_state:
     st.session_state.exam_integrator = None
 if 'scoring_weights' not in st.session_state:
@@ -559,17 +564,9 @@ def get_team_display_label(team_number):
 
 def get_foreshadowing_team_options():
     """Build ordered list of selectable teams for foreshadowing."""
-    stats = st.session_state.analizador.get_detailed_team_stats()
-    if not stats:
-        return []
-
-    options = []
-    for stat in stats:
-        team_num = str(stat.get('team', '')).strip()
-        if not team_num:
-            continue
-        options.append((get_team_display_label(team_num), team_num))
-    return options
+    # The extractor computes the detailed stats once per data version and reuses them
+    team_numbers = st.session_state.foreshadowing_extractor.get_team_numbers()
+    return [(get_team_display_label(team_num), team_num) for team_num in team_numbers]
 
 
 def validate_alliance_selection(red, blue):
@@ -2485,8 +2482,7 @@ elif page == "🏆 Honor Roll System":
 elif page == "🔮 Foreshadowing":
     st.markdown("<div class='main-header'>🔮 Match Prediction (Foreshadowing)</div>", unsafe_allow_html=True)
 
-    stats = st.session_state.analizador.get_detailed_team_stats()
-    if not stats:
+    if not st.session_state.foreshadowing_extractor.get_team_numbers():
         st.info("Load scouting data to unlock match predictions.")
     else:
         team_options = get_foreshadowing_team_options()
@@ -2540,13 +2536,16 @@ elif page == "🔮 Foreshadowing":
                     st.session_state.foreshadowing_error = message
                     st.session_state.foreshadowing_prediction = None
                 else:
-                    extractor = TeamStatsExtractor(st.session_state.analizador)
-                    simulator = MatchSimulator()
+                    # Reused across reruns; the extractor drops its cache when the analyzer's
+                    # data_version changes and the simulator keeps its parsed game config
+                    extractor = st.session_state.foreshadowing_extractor
 
                     try:
-                        red_perf = [extractor.extract_team_performance(team) for team in selected_red]
-                        blue_perf = [extractor.extract_team_performance(team) for team in selected_blue]
-                        prediction = simulator.simulate_match(red_perf, blue_perf, num_simulations=iterations)
+                        if st.session_state.foreshadowing_simulator is None:
+                            st.session_state.foreshadowing_simulator = MatchSimulator()
+                        simulator = st.session_state.foreshadowing_simulator
+                        prediction = predict_match(extractor, simulator, selected_red, selected_blue,
+                                                   num_simulations=iterations)
                     except Exception as err:
                         st.session_state.foreshadowing_error = f"Prediction failed: {err}"
                         st.session_state.foreshadowing_prediction = None
@@ -2555,7 +2554,10 @@ elif page == "🔮 Foreshadowing":
                         st.session_state.foreshadowing_mode = "Monte Carlo" if run_extended else "Quick"
                         st.session_state.foreshadowing_last_iterations = iterations
                         st.session_state.foreshadowing_last_inputs = {"red": selected_red, "blue": selected_blue}
-                        st.session_state.foreshadowing_team_performance = {"red": red_perf, "blue": blue_perf}
+                        st.session_state.foreshadowing_team_performance = {
+                            "red": prediction.red_teams,
+                            "blue": prediction.blue_teams,
+                        }
                         st.session_state.foreshadowing_error = ""
 
             if st.session_state.foreshadowing_error: